@@ -5,18 +5,41 @@ A tool for generating anatomically-proportioned primitive meshes
 that serve as base templates for digital sculpting workflows.
 """
 
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.0.0"
 __author__ = "Figure Generator Contributors"
 
-from figure_generator.backends import (
-    create_backend,
-    get_available_backends,
-    is_running_in_blender,
-)
-from figure_generator.config import FigureConfig, load_config, save_config
-from figure_generator.exporters import export_figure, get_supported_formats
-from figure_generator.generator import FigureGenerator
-from figure_generator.presets import POSES, PRESETS
+if TYPE_CHECKING:
+    from figure_generator.backends import (
+        create_backend,
+        get_available_backends,
+        is_running_in_blender,
+    )
+    from figure_generator.config import FigureConfig, load_config, save_config
+    from figure_generator.exporters import export_figure, get_supported_formats
+    from figure_generator.generator import FigureGenerator
+    from figure_generator.presets import POSES, PRESETS
+
+# Public names and the submodule defining each. They are imported on first
+# access (PEP 562), so reading __version__ (as the CLI does) or running an
+# info command does not load the generator.
+_LAZY_IMPORTS: dict[str, str] = {
+    "create_backend": "figure_generator.backends",
+    "get_available_backends": "figure_generator.backends",
+    "is_running_in_blender": "figure_generator.backends",
+    "FigureConfig": "figure_generator.config",
+    "load_config": "figure_generator.config",
+    "save_config": "figure_generator.config",
+    "export_figure": "figure_generator.exporters",
+    "get_supported_formats": "figure_generator.exporters",
+    "FigureGenerator": "figure_generator.generator",
+    "POSES": "figure_generator.presets",
+    "PRESETS": "figure_generator.presets",
+}
 
 __all__ = [
     "FigureGenerator",
@@ -31,3 +54,19 @@ __all__ = [
     "get_available_backends",
     "create_backend",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including not-yet-imported public names."""
+    return sorted({*globals(), *_LAZY_IMPORTS})
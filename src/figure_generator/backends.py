@@ -25,14 +25,21 @@ from __future__ import annotations
 
 import importlib.util
 import math
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 if TYPE_CHECKING:
     import numpy as np
     from numpy.typing import NDArray
 
+# ``slots=True`` drops the per-instance ``__dict__`` but is only accepted by
+# ``dataclass`` on Python 3.10+
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 # =============================================================================
 # Constants
@@ -92,7 +99,7 @@ ICOSAHEDRON_FACES: list[tuple[int, int, int]] = [
 # =============================================================================
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MeshData:
     """
     Backend-agnostic container for mesh geometry data.
@@ -122,6 +129,21 @@ class MeshData:
     native: Any | None = None
 
 
+class PrimitiveSpec(NamedTuple):
+    """
+    Placement of a single primitive, computed before any mesh is created.
+
+    Attributes:
+        kind: Primitive type: "sphere", "cylinder", or "box".
+        name: Part name assigned to the resulting MeshData.
+        params: Keyword arguments for the matching ``MeshBackend.create_*`` method.
+    """
+
+    kind: str
+    name: str
+    params: dict[str, Any]
+
+
 # =============================================================================
 # Geometry Utilities
 # =============================================================================
@@ -137,19 +159,31 @@ def create_rotation_matrix(
     This is extracted as a utility to avoid duplicating rotation logic
     across backends and to provide consistent rotation behavior.
 
+    Matrices are cached per angle triple, since a figure reuses a handful
+    of rotations (vertical limbs, and one per arm side). The returned array
+    is shared and read-only.
+
     Args:
         rotation_degrees: Rotation angles in degrees as (rx, ry, rz).
 
     Returns:
-        3x3 rotation matrix as numpy array.
+        3x3 read-only rotation matrix as numpy array.
 
     Note:
         Uses scipy.spatial.transform.Rotation for robust quaternion-based
         rotation to avoid gimbal lock issues.
     """
+    return _rotation_matrix(tuple(rotation_degrees))
+
+
+@lru_cache(maxsize=64)
+def _rotation_matrix(rotation_degrees: tuple[float, ...]) -> NDArray[np.float64]:
+    """Build the (read-only) rotation matrix for ``create_rotation_matrix``."""
     from scipy.spatial.transform import Rotation
 
-    return Rotation.from_euler("xyz", rotation_degrees, degrees=True).as_matrix()
+    matrix = Rotation.from_euler("xyz", rotation_degrees, degrees=True).as_matrix()
+    matrix.flags.writeable = False
+    return matrix
 
 
 def apply_transform(
@@ -175,17 +209,16 @@ def apply_transform(
         >>> verts = np.array([[1, 0, 0], [0, 1, 0]])
         >>> transformed = apply_transform(verts, (0, 0, 90), (5, 0, 0))
     """
-    import numpy as np
-
-    result = vertices.copy()
-
-    # Apply rotation if any angle is non-zero
+    # Apply rotation if any angle is non-zero; either branch yields a new
+    # array, so the translation below can be applied in place
     if any(angle != 0 for angle in rotation_degrees):
         rotation_matrix = create_rotation_matrix(rotation_degrees)
-        result = result @ rotation_matrix.T
+        result = vertices @ rotation_matrix.T
+    else:
+        result = vertices.astype(float, copy=True)
 
     # Apply translation
-    result = result + np.array(translation)
+    result += translation
 
     return result
 
@@ -225,6 +258,29 @@ def generate_icosphere_geometry(
         Tuple of (vertices, faces) where vertices is Nx3 float array
         and faces is Mx3 integer array.
     """
+    unit_vertices, faces = _unit_icosphere(subdivisions)
+
+    # Scale the shared unit template; both returned arrays are fresh copies
+    return unit_vertices * radius, faces.copy()
+
+
+@lru_cache(maxsize=8)
+def _unit_icosphere(
+    subdivisions: int,
+) -> tuple[NDArray[np.float64], NDArray[np.int64]]:
+    """
+    Build a unit-radius icosphere, cached per subdivision level.
+
+    Subdivision is the expensive part of sphere generation and its result
+    depends only on the level, so every sphere of a figure shares one
+    template. The arrays are marked read-only since they are shared.
+
+    Args:
+        subdivisions: Number of subdivision iterations.
+
+    Returns:
+        Tuple of read-only (vertices, faces) arrays.
+    """
     import numpy as np
 
     # Initialize with icosahedron geometry
@@ -239,9 +295,8 @@ def generate_icosphere_geometry(
     for _ in range(subdivisions):
         vertices, faces = _subdivide_icosphere(vertices, faces)
 
-    # Scale to desired radius
-    vertices = vertices * radius
-
+    vertices.flags.writeable = False
+    faces.flags.writeable = False
     return vertices, faces
 
 
@@ -318,6 +373,29 @@ def generate_cylinder_geometry(
     Returns:
         Tuple of (vertices, faces) arrays.
     """
+    unit_vertices, faces = _unit_cylinder(sections)
+
+    # Scale the shared unit template; both returned arrays are fresh copies
+    return unit_vertices * (radius, radius, height), faces.copy()
+
+
+@lru_cache(maxsize=8)
+def _unit_cylinder(
+    sections: int,
+) -> tuple[NDArray[np.float64], NDArray[np.int64]]:
+    """
+    Build a cylinder of radius 1 and height 1, cached per section count.
+
+    Only the section count affects topology, so every cylinder of a figure
+    is a scaled copy of one template. The arrays are marked read-only since
+    they are shared.
+
+    Args:
+        sections: Number of segments around circumference.
+
+    Returns:
+        Tuple of read-only (vertices, faces) arrays.
+    """
     import numpy as np
 
     # Generate circle points
@@ -325,13 +403,13 @@ def generate_cylinder_geometry(
     cos_angles = np.cos(angles)
     sin_angles = np.sin(angles)
 
-    half_height = height / 2
+    half_height = 0.5
 
     # Bottom circle vertices
     bottom_ring = np.column_stack(
         [
-            radius * cos_angles,
-            radius * sin_angles,
+            cos_angles,
+            sin_angles,
             np.full(sections, -half_height),
         ]
     )
@@ -339,8 +417,8 @@ def generate_cylinder_geometry(
     # Top circle vertices
     top_ring = np.column_stack(
         [
-            radius * cos_angles,
-            radius * sin_angles,
+            cos_angles,
+            sin_angles,
             np.full(sections, half_height),
         ]
     )
@@ -369,7 +447,10 @@ def generate_cylinder_geometry(
         # Top cap triangle
         faces.append([top_center_idx, sections + i, sections + next_i])
 
-    return vertices, np.array(faces, dtype=np.int64)
+    face_array = np.array(faces, dtype=np.int64)
+    vertices.flags.writeable = False
+    face_array.flags.writeable = False
+    return vertices, face_array
 
 
 def generate_box_geometry(
@@ -387,9 +468,23 @@ def generate_box_geometry(
     Returns:
         Tuple of (vertices, faces) arrays.
     """
+    unit_vertices, faces = _unit_box()
+
+    # Scale the shared unit template; both returned arrays are fresh copies
+    return unit_vertices * extents, faces.copy()
+
+
+@lru_cache(maxsize=1)
+def _unit_box() -> tuple[NDArray[np.float64], NDArray[np.int64]]:
+    """
+    Build a unit cube centered at origin, cached and shared by all boxes.
+
+    Returns:
+        Tuple of read-only (vertices, faces) arrays.
+    """
     import numpy as np
 
-    half_w, half_h, half_d = [e / 2 for e in extents]
+    half_w = half_h = half_d = 0.5
 
     # 8 corner vertices
     vertices = np.array(
@@ -425,6 +520,8 @@ def generate_box_geometry(
         dtype=np.int64,
     )
 
+    vertices.flags.writeable = False
+    faces.flags.writeable = False
     return vertices, faces
 
 
@@ -474,6 +571,7 @@ class MeshBackend(ABC):
         radius: float,
         center: tuple[float, float, float],
         subdivisions: int = DEFAULT_SPHERE_SUBDIVISIONS,
+        name: str = "",
     ) -> MeshData:
         """
         Create a sphere (icosphere) mesh.
@@ -482,6 +580,7 @@ class MeshBackend(ABC):
             radius: Sphere radius in scene units.
             center: Center position as (x, y, z).
             subdivisions: Icosphere subdivision level.
+            name: Part name for the returned MeshData (and native object).
 
         Returns:
             MeshData containing sphere geometry.
@@ -496,6 +595,7 @@ class MeshBackend(ABC):
         center: tuple[float, float, float],
         rotation_degrees: tuple[float, float, float] = (0, 0, 0),
         sections: int = DEFAULT_CYLINDER_SECTIONS,
+        name: str = "",
     ) -> MeshData:
         """
         Create a cylinder mesh with optional rotation.
@@ -509,6 +609,7 @@ class MeshBackend(ABC):
             center: Center position as (x, y, z).
             rotation_degrees: Euler rotation as (rx, ry, rz) in degrees.
             sections: Number of segments around circumference.
+            name: Part name for the returned MeshData (and native object).
 
         Returns:
             MeshData containing cylinder geometry.
@@ -521,6 +622,7 @@ class MeshBackend(ABC):
         extents: tuple[float, float, float],
         center: tuple[float, float, float],
         rotation_degrees: tuple[float, float, float] = (0, 0, 0),
+        name: str = "",
     ) -> MeshData:
         """
         Create a box mesh with optional rotation.
@@ -529,12 +631,163 @@ class MeshBackend(ABC):
             extents: Box dimensions as (width, height, depth).
             center: Center position as (x, y, z).
             rotation_degrees: Euler rotation as (rx, ry, rz) in degrees.
+            name: Part name for the returned MeshData (and native object).
 
         Returns:
             MeshData containing box geometry.
         """
         pass
 
+    def create_spheres_batch(
+        self,
+        radius: float,
+        centers: Sequence[tuple[float, float, float]],
+        subdivisions: int = DEFAULT_SPHERE_SUBDIVISIONS,
+        names: Sequence[str] | None = None,
+    ) -> list[MeshData]:
+        """
+        Create several spheres of the same radius and resolution.
+
+        The default implementation calls ``create_sphere`` per center.
+        Backends can override it to tessellate once and translate copies.
+
+        Args:
+            radius: Sphere radius shared by all spheres.
+            centers: Center position of each sphere as (x, y, z).
+            subdivisions: Icosphere subdivision level.
+            names: Optional part name per sphere (defaults to "").
+
+        Returns:
+            List of MeshData, one per center, in the same order.
+        """
+        names = names if names is not None else [""] * len(centers)
+        return [
+            self.create_sphere(radius, center, subdivisions, name=name)
+            for center, name in zip(centers, names)
+        ]
+
+    def create_cylinders_batch(
+        self,
+        radius: float,
+        height: float,
+        centers: Sequence[tuple[float, float, float]],
+        rotations: Sequence[tuple[float, float, float]],
+        sections: int = DEFAULT_CYLINDER_SECTIONS,
+        names: Sequence[str] | None = None,
+    ) -> list[MeshData]:
+        """
+        Create several cylinders of the same size and resolution.
+
+        The default implementation calls ``create_cylinder`` per center.
+        Backends can override it to tessellate once and transform copies.
+
+        Args:
+            radius: Cylinder radius shared by all cylinders.
+            height: Cylinder height shared by all cylinders.
+            centers: Center position of each cylinder as (x, y, z).
+            rotations: Euler rotation (degrees) of each cylinder.
+            sections: Number of segments around circumference.
+            names: Optional part name per cylinder (defaults to "").
+
+        Returns:
+            List of MeshData, one per center, in the same order.
+        """
+        names = names if names is not None else [""] * len(centers)
+        return [
+            self.create_cylinder(radius, height, center, rotation, sections, name=name)
+            for center, rotation, name in zip(centers, rotations, names)
+        ]
+
+    def create_boxes_batch(
+        self,
+        extents: tuple[float, float, float],
+        centers: Sequence[tuple[float, float, float]],
+        rotations: Sequence[tuple[float, float, float]],
+        names: Sequence[str] | None = None,
+    ) -> list[MeshData]:
+        """
+        Create several boxes with the same extents.
+
+        The default implementation calls ``create_box`` per center.
+        Backends can override it to build the box once and transform copies.
+
+        Args:
+            extents: Box dimensions (width, height, depth) shared by all boxes.
+            centers: Center position of each box as (x, y, z).
+            rotations: Euler rotation (degrees) of each box.
+            names: Optional part name per box (defaults to "").
+
+        Returns:
+            List of MeshData, one per center, in the same order.
+        """
+        names = names if names is not None else [""] * len(centers)
+        return [
+            self.create_box(extents, center, rotation, name=name)
+            for center, rotation, name in zip(centers, rotations, names)
+        ]
+
+    def create_primitives(self, specs: list[PrimitiveSpec]) -> list[MeshData]:
+        """
+        Create a batch of primitives in one call.
+
+        The default implementation groups specs by kind and shape, so parts
+        that differ only in placement (such as left/right pairs) are created
+        together through ``create_spheres_batch``, ``create_cylinders_batch``
+        or ``create_boxes_batch``. Backends can override this method to share
+        more work across the whole batch.
+
+        Args:
+            specs: Primitive placements, in output order.
+
+        Returns:
+            List of MeshData, one per spec, named from ``spec.name``.
+
+        Raises:
+            ValueError: If a spec has an unknown primitive kind.
+        """
+        groups: dict[tuple[Any, ...], list[int]] = {}
+        for i, (kind, _, params) in enumerate(specs):
+            key: tuple[Any, ...]
+            if kind == "sphere":
+                key = (
+                    kind,
+                    params["radius"],
+                    params.get("subdivisions", DEFAULT_SPHERE_SUBDIVISIONS),
+                )
+            elif kind == "cylinder":
+                key = (
+                    kind,
+                    params["radius"],
+                    params["height"],
+                    params.get("sections", DEFAULT_CYLINDER_SECTIONS),
+                )
+            elif kind == "box":
+                key = (kind, tuple(params["extents"]))
+            else:
+                raise ValueError(f"Unknown primitive kind '{kind}'")
+            groups.setdefault(key, []).append(i)
+
+        meshes: list[Any] = [None] * len(specs)
+        for (kind, *shape), indices in groups.items():
+            centers = [specs[i].params["center"] for i in indices]
+            names = [specs[i].name for i in indices]
+            if kind == "sphere":
+                radius, subdivisions = shape
+                batch = self.create_spheres_batch(radius, centers, subdivisions, names=names)
+            else:
+                rotations = [specs[i].params.get("rotation_degrees", (0, 0, 0)) for i in indices]
+                if kind == "cylinder":
+                    radius, height, sections = shape
+                    batch = self.create_cylinders_batch(
+                        radius, height, centers, rotations, sections, names=names
+                    )
+                else:
+                    batch = self.create_boxes_batch(shape[0], centers, rotations, names=names)
+            for i, mesh in zip(indices, batch):
+                meshes[i] = mesh
+
+        return meshes
+
     @abstractmethod
     def export(
         self,
@@ -584,15 +837,21 @@ class TrimeshBackend(MeshBackend):
     Requires: pip install trimesh
     """
 
+    SUPPORTED_FORMATS: tuple[str, ...] = ("glb", "gltf", "obj", "stl", "ply", "off", "dae")
+
     def __init__(self) -> None:
         """Initialize trimesh backend and import dependencies."""
         import numpy as np
         import trimesh
-        from scipy.spatial.transform import Rotation
 
         self._trimesh = trimesh
         self._np = np
-        self._Rotation = Rotation
+        # Unit icospheres keyed by subdivision level, unit cylinders (radius 1,
+        # height 1) keyed by section count, and a unit cube; parts are scaled
+        # copies of these, so the caches stay bounded however many sizes occur
+        self._sphere_templates: dict[int, Any] = {}
+        self._cylinder_templates: dict[int, Any] = {}
+        self._box_template = trimesh.creation.box()
 
     @property
     def name(self) -> str:
@@ -617,9 +876,7 @@ class TrimeshBackend(MeshBackend):
             Transformed mesh object.
         """
         if any(r != 0 for r in rotation_degrees):
-            rotation_matrix = self._Rotation.from_euler(
-                "xyz", rotation_degrees, degrees=True
-            ).as_matrix()
+            rotation_matrix = create_rotation_matrix(rotation_degrees)
             transform = self._np.eye(4)
             transform[:3, :3] = rotation_matrix
             mesh.apply_transform(transform)
@@ -632,17 +889,25 @@ class TrimeshBackend(MeshBackend):
         radius: float,
         center: tuple[float, float, float],
         subdivisions: int = DEFAULT_SPHERE_SUBDIVISIONS,
+        name: str = "",
     ) -> MeshData:
         """Create an icosphere mesh at the specified position."""
-        mesh = self._trimesh.creation.icosphere(
-            subdivisions=subdivisions,
-            radius=radius,
+        template = self._sphere_templates.get(subdivisions)
+        if template is None:
+            template = self._trimesh.creation.icosphere(subdivisions=subdivisions, radius=1.0)
+            self._sphere_templates[subdivisions] = template
+
+        # Scaling a copy of the template skips re-running the subdivision
+        mesh = self._trimesh.Trimesh(
+            vertices=template.vertices * radius + center,
+            faces=template.faces.copy(),
+            process=False,
         )
-        mesh.apply_translation(center)
 
         return MeshData(
             vertices=mesh.vertices,
             faces=mesh.faces,
+            name=name,
             native=mesh,
         )
 
@@ -653,18 +918,25 @@ class TrimeshBackend(MeshBackend):
         center: tuple[float, float, float],
         rotation_degrees: tuple[float, float, float] = (0, 0, 0),
         sections: int = DEFAULT_CYLINDER_SECTIONS,
+        name: str = "",
     ) -> MeshData:
         """Create a cylinder mesh with optional rotation."""
-        mesh = self._trimesh.creation.cylinder(
-            radius=radius,
-            height=height,
-            sections=sections,
+        template = self._cylinder_templates.get(sections)
+        if template is None:
+            template = self._trimesh.creation.cylinder(radius=1.0, height=1.0, sections=sections)
+            self._cylinder_templates[sections] = template
+
+        mesh = self._trimesh.Trimesh(
+            vertices=template.vertices * (radius, radius, height),
+            faces=template.faces.copy(),
+            process=False,
         )
         mesh = self._apply_transform(mesh, rotation_degrees, center)
 
         return MeshData(
             vertices=mesh.vertices,
             faces=mesh.faces,
+            name=name,
             native=mesh,
         )
 
@@ -673,14 +945,20 @@ class TrimeshBackend(MeshBackend):
         extents: tuple[float, float, float],
         center: tuple[float, float, float],
         rotation_degrees: tuple[float, float, float] = (0, 0, 0),
+        name: str = "",
     ) -> MeshData:
         """Create a box mesh with optional rotation."""
-        mesh = self._trimesh.creation.box(extents=extents)
+        mesh = self._trimesh.Trimesh(
+            vertices=self._box_template.vertices * extents,
+            faces=self._box_template.faces.copy(),
+            process=False,
+        )
         mesh = self._apply_transform(mesh, rotation_degrees, center)
 
         return MeshData(
             vertices=mesh.vertices,
             faces=mesh.faces,
+            name=name,
             native=mesh,
         )
 
@@ -707,7 +985,7 @@ class TrimeshBackend(MeshBackend):
 
     def get_supported_formats(self) -> list[str]:
         """Return list of formats supported by trimesh."""
-        return ["glb", "gltf", "obj", "stl", "ply", "off", "dae"]
+        return list(self.SUPPORTED_FORMATS)
 
 
 class Open3DBackend(MeshBackend):
@@ -725,6 +1003,8 @@ class Open3DBackend(MeshBackend):
     Requires: pip install open3d
     """
 
+    SUPPORTED_FORMATS: tuple[str, ...] = ("obj", "stl", "ply", "off", "gltf", "glb")
+
     def __init__(self) -> None:
         """Initialize Open3D backend and import dependencies."""
         import numpy as np
@@ -743,6 +1023,7 @@ class Open3DBackend(MeshBackend):
         radius: float,
         center: tuple[float, float, float],
         subdivisions: int = DEFAULT_SPHERE_SUBDIVISIONS,
+        name: str = "",
     ) -> MeshData:
         """Create a sphere mesh using Open3D's UV sphere."""
         # Open3D uses resolution parameter (approximate subdivision equivalent)
@@ -758,6 +1039,7 @@ class Open3DBackend(MeshBackend):
         return MeshData(
             vertices=self._np.asarray(mesh.vertices),
             faces=self._np.asarray(mesh.triangles),
+            name=name,
             native=mesh,
         )
 
@@ -768,6 +1050,7 @@ class Open3DBackend(MeshBackend):
         center: tuple[float, float, float],
         rotation_degrees: tuple[float, float, float] = (0, 0, 0),
         sections: int = DEFAULT_CYLINDER_SECTIONS,
+        name: str = "",
     ) -> MeshData:
         """Create a cylinder mesh with optional rotation."""
         mesh = self._o3d.geometry.TriangleMesh.create_cylinder(
@@ -787,6 +1070,7 @@ class Open3DBackend(MeshBackend):
         return MeshData(
             vertices=self._np.asarray(mesh.vertices),
             faces=self._np.asarray(mesh.triangles),
+            name=name,
             native=mesh,
         )
 
@@ -795,6 +1079,7 @@ class Open3DBackend(MeshBackend):
         extents: tuple[float, float, float],
         center: tuple[float, float, float],
         rotation_degrees: tuple[float, float, float] = (0, 0, 0),
+        name: str = "",
     ) -> MeshData:
         """Create a box mesh with optional rotation."""
         mesh = self._o3d.geometry.TriangleMesh.create_box(
@@ -817,6 +1102,7 @@ class Open3DBackend(MeshBackend):
         return MeshData(
             vertices=self._np.asarray(mesh.vertices),
             faces=self._np.asarray(mesh.triangles),
+            name=name,
             native=mesh,
         )
 
@@ -842,7 +1128,7 @@ class Open3DBackend(MeshBackend):
 
     def get_supported_formats(self) -> list[str]:
         """Return list of formats supported by Open3D."""
-        return ["obj", "stl", "ply", "off", "gltf", "glb"]
+        return list(self.SUPPORTED_FORMATS)
 
 
 class NumpySTLBackend(MeshBackend):
@@ -861,6 +1147,8 @@ class NumpySTLBackend(MeshBackend):
     Requires: pip install numpy-stl
     """
 
+    SUPPORTED_FORMATS: tuple[str, ...] = ("stl",)
+
     def __init__(self) -> None:
         """Initialize numpy-stl backend and import dependencies."""
         import numpy as np
@@ -879,12 +1167,29 @@ class NumpySTLBackend(MeshBackend):
         radius: float,
         center: tuple[float, float, float],
         subdivisions: int = DEFAULT_SPHERE_SUBDIVISIONS,
+        name: str = "",
     ) -> MeshData:
         """Create an icosphere using shared geometry generator."""
         vertices, faces = generate_icosphere_geometry(radius, subdivisions)
-        vertices = vertices + self._np.array(center)
+        vertices += center  # Fresh array from the template, safe to shift in place
 
-        return MeshData(vertices=vertices, faces=faces)
+        return MeshData(vertices=vertices, faces=faces, name=name)
+
+    def create_spheres_batch(
+        self,
+        radius: float,
+        centers: Sequence[tuple[float, float, float]],
+        subdivisions: int = DEFAULT_SPHERE_SUBDIVISIONS,
+        names: Sequence[str] | None = None,
+    ) -> list[MeshData]:
+        """Create same-sized icospheres from one scaled template."""
+        vertices, faces = generate_icosphere_geometry(radius, subdivisions)
+        names = names if names is not None else [""] * len(centers)
+
+        return [
+            MeshData(vertices=vertices + center, faces=faces.copy(), name=name)
+            for center, name in zip(centers, names)
+        ]
 
     def create_cylinder(
         self,
@@ -893,24 +1198,68 @@ class NumpySTLBackend(MeshBackend):
         center: tuple[float, float, float],
         rotation_degrees: tuple[float, float, float] = (0, 0, 0),
         sections: int = DEFAULT_CYLINDER_SECTIONS,
+        name: str = "",
     ) -> MeshData:
         """Create a cylinder using shared geometry generator."""
         vertices, faces = generate_cylinder_geometry(radius, height, sections)
         vertices = apply_transform(vertices, rotation_degrees, center)
 
-        return MeshData(vertices=vertices, faces=faces)
+        return MeshData(vertices=vertices, faces=faces, name=name)
+
+    def create_cylinders_batch(
+        self,
+        radius: float,
+        height: float,
+        centers: Sequence[tuple[float, float, float]],
+        rotations: Sequence[tuple[float, float, float]],
+        sections: int = DEFAULT_CYLINDER_SECTIONS,
+        names: Sequence[str] | None = None,
+    ) -> list[MeshData]:
+        """Create same-sized cylinders from one scaled template."""
+        vertices, faces = generate_cylinder_geometry(radius, height, sections)
+        names = names if names is not None else [""] * len(centers)
+
+        return [
+            MeshData(
+                vertices=apply_transform(vertices, rotation, center),
+                faces=faces.copy(),
+                name=name,
+            )
+            for center, rotation, name in zip(centers, rotations, names)
+        ]
 
     def create_box(
         self,
         extents: tuple[float, float, float],
         center: tuple[float, float, float],
         rotation_degrees: tuple[float, float, float] = (0, 0, 0),
+        name: str = "",
     ) -> MeshData:
         """Create a box using shared geometry generator."""
         vertices, faces = generate_box_geometry(extents)
         vertices = apply_transform(vertices, rotation_degrees, center)
 
-        return MeshData(vertices=vertices, faces=faces)
+        return MeshData(vertices=vertices, faces=faces, name=name)
+
+    def create_boxes_batch(
+        self,
+        extents: tuple[float, float, float],
+        centers: Sequence[tuple[float, float, float]],
+        rotations: Sequence[tuple[float, float, float]],
+        names: Sequence[str] | None = None,
+    ) -> list[MeshData]:
+        """Create same-sized boxes from one scaled template."""
+        vertices, faces = generate_box_geometry(extents)
+        names = names if names is not None else [""] * len(centers)
+
+        return [
+            MeshData(
+                vertices=apply_transform(vertices, rotation, center),
+                faces=faces.copy(),
+                name=name,
+            )
+            for center, rotation, name in zip(centers, rotations, names)
+        ]
 
     def export(
         self,
@@ -943,7 +1292,7 @@ class NumpySTLBackend(MeshBackend):
 
     def get_supported_formats(self) -> list[str]:
         """Return list of formats supported (STL only)."""
-        return ["stl"]
+        return list(self.SUPPORTED_FORMATS)
 
 
 class BlenderBackend(MeshBackend):
@@ -967,6 +1316,20 @@ class BlenderBackend(MeshBackend):
         This backend is automatically selected when running inside Blender.
     """
 
+    SUPPORTED_FORMATS: tuple[str, ...] = (
+        "blend",
+        "glb",
+        "gltf",
+        "fbx",
+        "obj",
+        "stl",
+        "ply",
+        "dae",
+        "usd",
+        "usdc",
+        "usda",
+    )
+
     def __init__(self) -> None:
         """Initialize Blender backend and import bpy modules."""
         import bmesh
@@ -1043,6 +1406,7 @@ class BlenderBackend(MeshBackend):
         radius: float,
         center: tuple[float, float, float],
         subdivisions: int = DEFAULT_SPHERE_SUBDIVISIONS,
+        name: str = "",
     ) -> MeshData:
         """Create an icosphere using Blender's bmesh operations."""
         bmesh_mod = self._bmesh
@@ -1061,11 +1425,12 @@ class BlenderBackend(MeshBackend):
 
         bm.free()
 
-        obj = self._create_mesh_object(vertices, faces, "Sphere")
+        obj = self._create_mesh_object(vertices, faces, name or "Sphere")
 
         return MeshData(
             vertices=self._np.array(vertices),
             faces=self._np.array(faces),
+            name=name,
             native=obj,
         )
 
@@ -1076,6 +1441,7 @@ class BlenderBackend(MeshBackend):
         center: tuple[float, float, float],
         rotation_degrees: tuple[float, float, float] = (0, 0, 0),
         sections: int = DEFAULT_CYLINDER_SECTIONS,
+        name: str = "",
     ) -> MeshData:
         """Create a cylinder using Blender's bmesh operations."""
         bmesh_mod = self._bmesh
@@ -1102,11 +1468,12 @@ class BlenderBackend(MeshBackend):
         # Apply transformation
         vertices = apply_transform(vertices, rotation_degrees, center)
 
-        obj = self._create_mesh_object(vertices.tolist(), faces, "Cylinder")
+        obj = self._create_mesh_object(vertices.tolist(), faces, name or "Cylinder")
 
         return MeshData(
             vertices=vertices,
             faces=np.array(faces),
+            name=name,
             native=obj,
         )
 
@@ -1115,6 +1482,7 @@ class BlenderBackend(MeshBackend):
         extents: tuple[float, float, float],
         center: tuple[float, float, float],
         rotation_degrees: tuple[float, float, float] = (0, 0, 0),
+        name: str = "",
     ) -> MeshData:
         """Create a box using Blender's bmesh operations."""
         bmesh_mod = self._bmesh
@@ -1139,11 +1507,12 @@ class BlenderBackend(MeshBackend):
         # Apply transformation
         vertices = apply_transform(vertices, rotation_degrees, center)
 
-        obj = self._create_mesh_object(vertices.tolist(), faces, "Box")
+        obj = self._create_mesh_object(vertices.tolist(), faces, name or "Box")
 
         return MeshData(
             vertices=vertices,
             faces=np.array(faces),
+            name=name,
             native=obj,
         )
 
@@ -1206,7 +1575,7 @@ class BlenderBackend(MeshBackend):
 
     def get_supported_formats(self) -> list[str]:
         """Return list of formats supported by Blender export."""
-        return ["blend", "glb", "gltf", "fbx", "obj", "stl", "ply", "dae", "usd", "usdc", "usda"]
+        return list(self.SUPPORTED_FORMATS)
 
     def get_created_objects(self) -> list[Any]:
         """
@@ -1232,6 +1601,15 @@ class BlenderBackend(MeshBackend):
 # =============================================================================
 
 
+# Backend classes by name, in the order get_available_backends() reports them
+_BACKEND_CLASSES: dict[str, type[MeshBackend]] = {
+    "trimesh": TrimeshBackend,
+    "open3d": Open3DBackend,
+    "numpy-stl": NumpySTLBackend,
+    "blender": BlenderBackend,
+}
+
+
 def _check_available(module_name: str) -> bool:
     """
     Check if a Python module is available for import.
@@ -1310,13 +1688,18 @@ def create_backend(name: str | None = None) -> MeshBackend:
         Instantiated MeshBackend subclass.
 
     Raises:
-        ValueError: If no backends are available.
+        ValueError: If name is not a known backend, or no backends are
+            available.
         ImportError: If requested backend is not installed.
 
     Example:
         >>> backend = create_backend()  # Auto-select
         >>> backend = create_backend("trimesh")  # Specific backend
     """
+    # Reject unknown names before probing for installed libraries
+    if name is not None and name not in _BACKEND_CLASSES:
+        raise ValueError(f"Unknown backend: {name}. Known backends: {', '.join(_BACKEND_CLASSES)}")
+
     available = get_available_backends()
 
     if not available:
@@ -1339,15 +1722,4 @@ def create_backend(name: str | None = None) -> MeshBackend:
         raise ImportError(f"Backend '{name}' not available. " f"Available backends: {available}")
 
     # Instantiate requested backend
-    backend_classes: dict[str, type[MeshBackend]] = {
-        "trimesh": TrimeshBackend,
-        "open3d": Open3DBackend,
-        "numpy-stl": NumpySTLBackend,
-        "blender": BlenderBackend,
-    }
-
-    backend_class = backend_classes.get(name)
-    if backend_class is None:
-        raise ValueError(f"Unknown backend: {name}")
-
-    return backend_class()  # type: ignore[abstract]
+    return _BACKEND_CLASSES[name]()  # type: ignore[abstract]
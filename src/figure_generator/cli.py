@@ -17,10 +17,42 @@ import sys
 from pathlib import Path
 
 from figure_generator import __version__
-from figure_generator.backends import create_backend, get_available_backends
+from figure_generator.backends import (
+    BlenderBackend,
+    NumpySTLBackend,
+    Open3DBackend,
+    TrimeshBackend,
+    create_backend,
+    get_available_backends,
+)
 from figure_generator.config import load_config
-from figure_generator.generator import FigureGenerator
-from figure_generator.presets import POSES, PRESETS, get_pose_names, get_preset_names
+from figure_generator.presets import POSE_NAMES, POSES, PRESET_NAMES, PRESETS
+
+# Export formats per backend, read from the backend classes so --list-backends
+# can report them without instantiating (and importing) every mesh library
+_STATIC_FORMATS: dict[str, tuple[str, ...]] = {
+    "trimesh": TrimeshBackend.SUPPORTED_FORMATS,
+    "open3d": Open3DBackend.SUPPORTED_FORMATS,
+    "numpy-stl": NumpySTLBackend.SUPPORTED_FORMATS,
+    "blender": BlenderBackend.SUPPORTED_FORMATS,
+}
+
+_INSTALL_HINTS: dict[str, str] = {
+    "trimesh": "pip install trimesh",
+    "open3d": "pip install open3d",
+    "numpy-stl": "pip install numpy-stl",
+    "blender": "run inside Blender",
+}
+
+
+def _pose_to_angle(pose_name: str) -> float:
+    """Resolve a --pose name to its arm angle in degrees."""
+    try:
+        return POSES[pose_name]
+    except KeyError:
+        raise argparse.ArgumentTypeError(
+            f"invalid pose '{pose_name}' (choose from {', '.join(POSE_NAMES)})"
+        ) from None
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -56,7 +88,7 @@ Examples:
     input_mutex = input_group.add_mutually_exclusive_group()
 
     input_mutex.add_argument(
-        "--preset", "-p", type=str, choices=get_preset_names(), help="Use built-in preset"
+        "--preset", "-p", type=str, choices=PRESET_NAMES, help="Use built-in preset"
     )
 
     input_mutex.add_argument(
@@ -69,9 +101,9 @@ Examples:
 
     pose_mutex.add_argument(
         "--pose",
-        type=str,
-        choices=get_pose_names(),
+        type=_pose_to_angle,
         default="apose",
+        metavar="{" + ",".join(POSE_NAMES) + "}",
         help="Arm pose preset (default: apose)",
     )
 
@@ -162,37 +194,36 @@ def list_poses() -> None:
     print()
 
 
-def list_backends() -> None:
-    """Print available backends and their formats."""
+def list_backends(verbose: bool = False) -> None:
+    """
+    Print available backends and their formats.
+
+    Formats come from a static table by default. With verbose=True each
+    installed backend (except Blender) is instantiated and queried instead.
+    """
     print("Available backends:")
     print("-" * 50)
 
     available = get_available_backends()
-    all_backends = ["trimesh", "open3d", "numpy-stl", "blender"]
 
-    for name in all_backends:
+    for name in _STATIC_FORMATS:
         status = "✓" if name in available else "✗"
-        if name in available:
+        if name not in available:
+            print(f"  {status} {name:12} (not installed: {_INSTALL_HINTS[name]})")
+            continue
+
+        formats: tuple[str, ...] | list[str] = _STATIC_FORMATS[name]
+        # Don't try to instantiate blender backend outside Blender
+        if verbose and name != "blender":
             try:
-                if name == "blender":
-                    # Don't try to instantiate blender backend outside Blender
-                    formats = "blend, glb, gltf, fbx, obj, stl, ply, dae, usd"
-                    print(f"  {status} {name:12} formats: {formats}")
-                    print("                    (use via: blender --python blender_script.py)")
-                else:
-                    b = create_backend(name)
-                    formats = ", ".join(b.get_supported_formats())
-                    print(f"  {status} {name:12} formats: {formats}")
+                formats = create_backend(name).get_supported_formats()
             except Exception as e:
                 print(f"  {status} {name:12} (error: {e})")
-        else:
-            install_hint = {
-                "trimesh": "pip install trimesh",
-                "open3d": "pip install open3d",
-                "numpy-stl": "pip install numpy-stl",
-                "blender": "run inside Blender",
-            }.get(name, "")
-            print(f"  {status} {name:12} (not installed: {install_hint})")
+                continue
+
+        print(f"  {status} {name:12} formats: {', '.join(formats)}")
+        if name == "blender":
+            print("                    (use via: blender --python blender_script.py)")
     print()
 
 
@@ -226,18 +257,20 @@ def run_generation(args: argparse.Namespace) -> int:
             print(f"Using preset: {preset_name}")
         config = preset_name  # Generator accepts preset names
 
-    # Determine arm angle
-    if args.arm_angle is not None:
-        arm_angle = args.arm_angle
-    else:
-        arm_angle = POSES[args.pose]
+    # Determine arm angle (--pose is already resolved to degrees by the parser)
+    arm_angle = args.arm_angle if args.arm_angle is not None else args.pose
 
     if args.verbose:
         print(f"Arm angle: {arm_angle}°")
 
-    # Create generator with specified backend
+    # Imported here so info commands (--list-*, --generate-config) skip it; the
+    # package __init__ imports its public names lazily for the same reason
+    from figure_generator.generator import FigureGenerator
+
+    # Create the backend up front (auto-selected when --backend is omitted) so
+    # a missing mesh library is reported here rather than mid-generation
     try:
-        generator = FigureGenerator(backend=create_backend(args.backend) if args.backend else None)
+        generator = FigureGenerator(backend=create_backend(args.backend))
     except ImportError as e:
         print(f"Error: {e}", file=sys.stderr)
         return 1
@@ -296,7 +329,7 @@ def main(argv: list | None = None) -> int:
         return 0
 
     if args.list_backends:
-        list_backends()
+        list_backends(verbose=args.verbose)
         return 0
 
     if args.generate_config:
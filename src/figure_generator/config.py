@@ -8,12 +8,17 @@ and utilities for loading/saving JSON configs.
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass
+import sys
+from dataclasses import asdict, dataclass, fields, is_dataclass
 from pathlib import Path
 from typing import Any
 
+# Keyword arguments shared by the config dataclasses. ``slots=True`` drops the
+# per-instance ``__dict__`` but is only accepted by ``dataclass`` on Python 3.10+.
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class BodyPartConfig:
     """Configuration for a cylindrical body part."""
 
@@ -27,7 +32,7 @@ class BodyPartConfig:
             raise ValueError(f"length must be positive, got {self.length}")
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class BoxPartConfig:
     """Configuration for a box-shaped body part."""
 
@@ -41,7 +46,7 @@ class BoxPartConfig:
                 raise ValueError(f"{name} must be positive, got {val}")
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class SpherePartConfig:
     """Configuration for a spherical body part with offset positioning."""
 
@@ -55,7 +60,7 @@ class SpherePartConfig:
             raise ValueError(f"radius must be positive, got {self.radius}")
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class FootConfig:
     """Configuration for foot dimensions."""
 
@@ -69,7 +74,7 @@ class FootConfig:
                 raise ValueError(f"{name} must be positive, got {val}")
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class HandConfig:
     """Configuration for hand dimensions."""
 
@@ -83,7 +88,7 @@ class HandConfig:
                 raise ValueError(f"{name} must be positive, got {val}")
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class LandmarksConfig:
     """Y-axis positions for anatomical landmarks."""
 
@@ -95,27 +100,28 @@ class LandmarksConfig:
     knee_y: float
 
     def __post_init__(self) -> None:
-        # Validate landmarks are in descending order (top to bottom)
-        order = [
-            self.shoulder_y,
-            self.bust_y,
-            self.waist_y,
-            self.pelvis_y,
-            self.crotch_y,
-            self.knee_y,
-        ]
-        for i in range(len(order) - 1):
-            if order[i] < order[i + 1]:
-                raise ValueError("Landmarks must be in descending Y order (top to bottom)")
-
-
-@dataclass
+        # Validate landmarks are in descending order (top to bottom); a chained
+        # comparison checks each adjacent pair without building a list
+        if not (
+            self.shoulder_y
+            >= self.bust_y
+            >= self.waist_y
+            >= self.pelvis_y
+            >= self.crotch_y
+            >= self.knee_y
+        ):
+            raise ValueError("Landmarks must be in descending Y order (top to bottom)")
+
+
+@dataclass(frozen=True, **_SLOTS)
 class FigureConfig:
     """
     Complete configuration for a figure's proportions.
 
     This dataclass defines all parameters needed to generate a figure,
     following classical figure drawing proportions measured in "head units".
+    Instances are immutable, so a validated config can be shared freely
+    (use ``dataclasses.replace`` to derive variants).
 
     Attributes:
         name: Human-readable name for this configuration
@@ -221,6 +227,23 @@ class FigureConfig:
         )
 
 
+def _json_default(obj: Any) -> dict[str, Any]:
+    """
+    Serialize config dataclasses for ``json.dumps`` (see ``save_config``).
+
+    Each dataclass is converted one level at a time as the encoder reaches it,
+    so no intermediate nested dict is built up front. Fields set to None (the
+    optional ``breasts``) are omitted, matching ``FigureConfig.to_dict()``.
+
+    Raises:
+        TypeError: If obj is not a dataclass instance
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        values = ((f.name, getattr(obj, f.name)) for f in fields(obj))
+        return {name: value for name, value in values if value is not None}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def load_config(path: str | Path) -> FigureConfig:
     """
     Load configuration from a JSON file.
@@ -236,9 +259,8 @@ def load_config(path: str | Path) -> FigureConfig:
         json.JSONDecodeError: If file contains invalid JSON
         ValueError: If configuration is invalid
     """
-    path = Path(path)
-    with open(path, encoding="utf-8") as f:
-        data = json.load(f)
+    # One read, then parse; json.loads detects the UTF-8/16/32 encoding of bytes
+    data = json.loads(Path(path).read_bytes())
     return FigureConfig.from_dict(data)
 
 
@@ -250,6 +272,7 @@ def save_config(config: FigureConfig, path: str | Path) -> None:
         config: FigureConfig instance to save
         path: Output file path
     """
-    path = Path(path)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(config.to_dict(), f, indent=2)
+    # Encode to one string and write it once; json.dump would issue a write()
+    # per encoded token
+    text = json.dumps(config, indent=2, default=_json_default)
+    Path(path).write_text(text, encoding="utf-8")
@@ -23,13 +23,15 @@ Example:
 
 from __future__ import annotations
 
-import math
+from collections.abc import Callable, Hashable, Iterable
 from dataclasses import dataclass
+from functools import lru_cache
+from math import cos, radians, sin
 from typing import TYPE_CHECKING, Any
 
-from figure_generator.backends import MeshBackend, MeshData, create_backend
+from figure_generator.backends import MeshBackend, MeshData, PrimitiveSpec, create_backend
 from figure_generator.config import FigureConfig
-from figure_generator.presets import PRESETS
+from figure_generator.presets import POSES, get_preset_config
 
 if TYPE_CHECKING:
     pass
@@ -52,6 +54,134 @@ FOOT_FORWARD_OFFSET: float = 0.12
 DEFAULT_ARM_ANGLE: float = 45.0
 
 
+# =============================================================================
+# Layout Helpers
+# =============================================================================
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Return a hashable snapshot of a config value.
+
+    Dicts become sorted item tuples and every other value is tagged with its
+    type, so ``1``, ``1.0`` and ``True`` give distinct snapshots.
+    """
+    if isinstance(value, dict):
+        return (dict, tuple(sorted((key, _freeze(item)) for key, item in value.items())))
+    return (type(value), value)
+
+
+def _thaw(snapshot: Any) -> Any:
+    """Rebuild the config value captured by ``_freeze``."""
+    kind, value = snapshot
+    if kind is dict:
+        return {key: _thaw(item) for key, item in value}
+    return value
+
+
+@lru_cache(maxsize=32)
+def _config_from_snapshot(snapshot: Hashable) -> FigureConfig:
+    """Parse a frozen config dict, cached so equal dicts share one FigureConfig."""
+    return FigureConfig.from_dict(_thaw(snapshot))
+
+
+def _dict_config(data: dict[str, Any]) -> FigureConfig:
+    """
+    Parse a config dict into a FigureConfig, reusing earlier results.
+
+    Equal dicts map to the same (immutable) FigureConfig. Dicts holding
+    unhashable values (or unsortable keys) are parsed without caching.
+    """
+    try:
+        snapshot = _freeze(data)
+        hash(snapshot)
+    except TypeError:
+        return FigureConfig.from_dict(data)
+
+    return _config_from_snapshot(snapshot)
+
+
+def _same_config(config: FigureConfig) -> FigureConfig:
+    """Return an already-built FigureConfig unchanged."""
+    return config
+
+
+# Config resolvers keyed by exact input type, so the common inputs cost one
+# dict lookup; _resolve_config falls back to isinstance() for subclasses
+_CONFIG_RESOLVERS: dict[type, Callable[[Any], FigureConfig]] = {
+    str: get_preset_config,
+    dict: _dict_config,
+    FigureConfig: _same_config,
+}
+
+
+@lru_cache(maxsize=64)
+def _sincos_deg(angle_deg: float) -> tuple[float, float]:
+    """
+    Return (cos, sin) of an angle given in degrees, cached per angle.
+
+    Arm angles come from a small set in practice (the pose presets), so
+    repeated generation hits the cache instead of recomputing the trig.
+    """
+    angle_rad = radians(angle_deg)
+    return cos(angle_rad), sin(angle_rad)
+
+
+# Precompute the built-in pose angles at import, so generating a preset pose
+# never evaluates trig at runtime
+for _pose_angle in POSES.values():
+    _sincos_deg(_pose_angle)
+del _pose_angle
+
+
+def _arm_chain_centers(
+    shoulder_x: float,
+    shoulder_y: float,
+    cos_a: float,
+    sin_a: float,
+    upper_arm_length: float,
+    forearm_length: float,
+    hand_length: float,
+) -> tuple[tuple[float, float], tuple[float, float], tuple[float, float]]:
+    """
+    Walk the shoulder -> elbow -> wrist chain and return segment centers.
+
+    X values are unsigned distances from the body center, so the same chain
+    serves both arms once multiplied by the side's X sign.
+
+    Args:
+        shoulder_x: X distance from center to shoulder joint.
+        shoulder_y: Y height of shoulder joint.
+        cos_a: Cosine of the arm angle.
+        sin_a: Sine of the arm angle.
+        upper_arm_length: Length of the upper arm.
+        forearm_length: Length of the forearm.
+        hand_length: Length of the hand.
+
+    Returns:
+        (x, y) centers of the upper arm, forearm, and hand.
+    """
+    # Each segment center sits half a segment along the arm direction from
+    # its starting joint; the next joint sits a full segment away
+    half_x = cos_a * upper_arm_length / 2
+    half_y = sin_a * upper_arm_length / 2
+    upper_arm = (shoulder_x + half_x, shoulder_y - half_y)
+    elbow_x = shoulder_x + 2 * half_x
+    elbow_y = shoulder_y - 2 * half_y
+
+    half_x = cos_a * forearm_length / 2
+    half_y = sin_a * forearm_length / 2
+    forearm = (elbow_x + half_x, elbow_y - half_y)
+    wrist_x = elbow_x + 2 * half_x
+    wrist_y = elbow_y - 2 * half_y
+
+    half_x = cos_a * hand_length / 2
+    half_y = sin_a * hand_length / 2
+    hand = (wrist_x + half_x, wrist_y - half_y)
+
+    return upper_arm, forearm, hand
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -64,7 +194,8 @@ class GeneratedFigure:
 
     Holds all the mesh parts that make up a figure along with the
     configuration used to generate it. This allows for inspection,
-    modification, and export of the generated figure.
+    modification, and export of the generated figure: ``meshes`` may be
+    edited in place, and ``part_names``/``part_count`` always reflect it.
 
     Attributes:
         meshes: List of MeshData objects, one per body part.
@@ -91,6 +222,19 @@ class GeneratedFigure:
         """
         return [mesh.name for mesh in self.meshes]
 
+    @property
+    def part_name_set(self) -> frozenset[str]:
+        """
+        Return body part names as a frozenset for fast membership tests.
+
+        Built from ``meshes`` on each access; keep a reference to the result
+        when checking several names.
+
+        Returns:
+            Frozenset of part name strings.
+        """
+        return frozenset(mesh.name for mesh in self.meshes)
+
     @property
     def part_count(self) -> int:
         """
@@ -142,15 +286,26 @@ class FigureGenerator:
         >>> generator.export(figure, "output.glb")
     """
 
+    __slots__ = ("_backend_instance",)
+
     def __init__(self, backend: MeshBackend | None = None) -> None:
         """
         Initialize the figure generator.
 
         Args:
             backend: MeshBackend instance for mesh creation. If None,
-                automatically selects the best available backend.
+                the best available backend is selected on first use.
         """
-        self._backend = backend or create_backend()
+        # Auto-selection imports the mesh library, so it is deferred until a
+        # method actually needs the backend
+        self._backend_instance = backend
+
+    @property
+    def _backend(self) -> MeshBackend:
+        """Return the mesh backend, creating the default one on first access."""
+        if self._backend_instance is None:
+            self._backend_instance = create_backend()
+        return self._backend_instance
 
     @property
     def backend_name(self) -> str:
@@ -215,6 +370,56 @@ class FigureGenerator:
             arm_angle=arm_angle,
         )
 
+    def generate_many(
+        self,
+        config: FigureConfig | str | dict[str, Any],
+        arm_angles: Iterable[float],
+    ) -> list[GeneratedFigure]:
+        """
+        Generate one figure per arm angle from a single configuration.
+
+        The configuration is resolved once, and every part except the arms
+        is laid out once and reused, so generating many poses of the same
+        figure (e.g. for datasets) avoids repeating that work per figure.
+        All returned figures share the resolved FigureConfig.
+
+        Args:
+            config: Figure configuration, as accepted by ``generate``.
+            arm_angles: Arm angles in degrees from vertical, one per figure.
+
+        Returns:
+            List of GeneratedFigure in the same order as ``arm_angles``.
+
+        Raises:
+            ValueError: If preset name is not recognized.
+            TypeError: If config is not a supported type.
+
+        Example:
+            >>> figures = generator.generate_many("male_adult", range(0, 91, 15))
+        """
+        resolved_config = self._resolve_config(config)
+
+        # Only the arms depend on the angle; keep anatomical order around them
+        body_specs = [
+            *self._layout_head_and_neck(resolved_config),
+            *self._layout_torso(resolved_config),
+            *self._layout_pelvis_and_glutes(resolved_config),
+        ]
+        leg_specs = self._layout_legs(resolved_config)
+
+        figures: list[GeneratedFigure] = []
+        for arm_angle in arm_angles:
+            specs = [*body_specs, *self._layout_arms(resolved_config, arm_angle), *leg_specs]
+            figures.append(
+                GeneratedFigure(
+                    meshes=self._backend.create_primitives(specs),
+                    config=resolved_config,
+                    arm_angle=arm_angle,
+                )
+            )
+
+        return figures
+
     def export(
         self,
         figure: GeneratedFigure,
@@ -257,35 +462,19 @@ class FigureGenerator:
             ValueError: If preset name is not found.
             TypeError: If config type is not supported.
         """
-        if isinstance(config, str):
-            return self._resolve_preset_name(config)
-        elif isinstance(config, dict):
-            return FigureConfig.from_dict(config)
-        elif isinstance(config, FigureConfig):
-            return config
-        else:
-            raise TypeError(
-                f"config must be FigureConfig, str, or dict, got {type(config).__name__}"
-            )
-
-    def _resolve_preset_name(self, preset_name: str) -> FigureConfig:
-        """
-        Look up a preset by name and return its FigureConfig.
-
-        Args:
-            preset_name: Name of preset (e.g., "female_adult").
+        resolver = _CONFIG_RESOLVERS.get(type(config))
+        if resolver is None:
+            # Subclasses (e.g. OrderedDict) miss the exact-type lookup
+            for base, base_resolver in _CONFIG_RESOLVERS.items():
+                if isinstance(config, base):
+                    resolver = base_resolver
+                    break
+            else:
+                raise TypeError(
+                    f"config must be FigureConfig, str, or dict, got {type(config).__name__}"
+                )
 
-        Returns:
-            FigureConfig for the named preset.
-
-        Raises:
-            ValueError: If preset name is not found.
-        """
-        if preset_name not in PRESETS:
-            available = list(PRESETS.keys())
-            raise ValueError(f"Unknown preset '{preset_name}'. Available: {available}")
-
-        return FigureConfig.from_dict(PRESETS[preset_name])
+        return resolver(config)
 
     # =========================================================================
     # Private Methods - Body Part Generation
@@ -299,6 +488,9 @@ class FigureGenerator:
         """
         Generate all body part meshes in anatomical order.
 
+        Placement for every part is computed up front by ``_layout_body_parts``;
+        the resulting specs are then handed to the backend as one batch.
+
         Args:
             config: Figure configuration with proportions.
             arm_angle: Arm angle in degrees from vertical.
@@ -306,22 +498,37 @@ class FigureGenerator:
         Returns:
             List of MeshData for all body parts.
         """
-        meshes: list[MeshData] = []
+        return self._backend.create_primitives(self._layout_body_parts(config, arm_angle))
 
-        # Core body parts
-        meshes.extend(self._generate_head_and_neck(config))
-        meshes.extend(self._generate_torso(config))
-        meshes.extend(self._generate_pelvis_and_glutes(config))
+    def _layout_body_parts(
+        self,
+        config: FigureConfig,
+        arm_angle: float,
+    ) -> list[PrimitiveSpec]:
+        """
+        Compute primitive placement for all body parts in anatomical order.
 
-        # Limbs
-        meshes.extend(self._generate_arms(config, arm_angle))
-        meshes.extend(self._generate_legs(config))
+        Args:
+            config: Figure configuration with proportions.
+            arm_angle: Arm angle in degrees from vertical.
 
-        return meshes
+        Returns:
+            List of PrimitiveSpec, one per body part.
+        """
+        # One literal builds the full list in a single allocation
+        return [
+            # Core body parts
+            *self._layout_head_and_neck(config),
+            *self._layout_torso(config),
+            *self._layout_pelvis_and_glutes(config),
+            # Limbs
+            *self._layout_arms(config, arm_angle),
+            *self._layout_legs(config),
+        ]
 
-    def _generate_head_and_neck(self, config: FigureConfig) -> list[MeshData]:
+    def _layout_head_and_neck(self, config: FigureConfig) -> list[PrimitiveSpec]:
         """
-        Generate head and neck meshes.
+        Lay out head and neck primitives.
 
         The head is positioned at the top of the figure based on total_heads
         height. The neck connects the head to the torso.
@@ -330,39 +537,43 @@ class FigureGenerator:
             config: Figure configuration.
 
         Returns:
-            List containing head and neck MeshData.
+            List containing head and neck specs.
         """
-        meshes: list[MeshData] = []
-        subdivisions = config.subdivisions
+        head_radius = config.head_radius
+        neck_cfg = config.neck
 
         # Head: sphere at top of figure
         # Position is total height minus head radius (so top of head = total_heads)
-        head_y = config.total_heads - config.head_radius
-        head = self._backend.create_sphere(
-            radius=config.head_radius,
-            center=(0, head_y, 0),
-            subdivisions=subdivisions,
+        head_y = config.total_heads - head_radius
+        head = PrimitiveSpec(
+            "sphere",
+            "Head",
+            {
+                "radius": head_radius,
+                "center": (0, head_y, 0),
+                "subdivisions": config.subdivisions,
+            },
         )
-        head.name = "Head"
-        meshes.append(head)
 
         # Neck: vertical cylinder connecting head to torso
         # Positioned between bottom of head and top of ribcage
-        neck_y = head_y - config.head_radius - config.neck.length / 2
-        neck = self._backend.create_cylinder(
-            radius=config.neck.radius,
-            height=config.neck.length,
-            center=(0, neck_y, 0),
-            rotation_degrees=(90, 0, 0),  # Rotate to vertical (along Y-axis)
+        neck_y = head_y - head_radius - neck_cfg.length / 2
+        neck = PrimitiveSpec(
+            "cylinder",
+            "Neck",
+            {
+                "radius": neck_cfg.radius,
+                "height": neck_cfg.length,
+                "center": (0, neck_y, 0),
+                "rotation_degrees": (90, 0, 0),  # Rotate to vertical (along Y-axis)
+            },
         )
-        neck.name = "Neck"
-        meshes.append(neck)
 
-        return meshes
+        return [head, neck]
 
-    def _generate_torso(self, config: FigureConfig) -> list[MeshData]:
+    def _layout_torso(self, config: FigureConfig) -> list[PrimitiveSpec]:
         """
-        Generate torso meshes: ribcage, breasts (optional), and abdomen.
+        Lay out torso primitives: ribcage, breasts (optional), and abdomen.
 
         The torso spans from shoulders to waist, with the ribcage forming
         the upper chest and the abdomen connecting to the pelvis.
@@ -371,49 +582,60 @@ class FigureGenerator:
             config: Figure configuration.
 
         Returns:
-            List containing ribcage, optional breasts, and abdomen MeshData.
+            List containing ribcage, optional breasts, and abdomen specs.
         """
-        meshes: list[MeshData] = []
+        specs: list[PrimitiveSpec] = []
         landmarks = config.landmarks
-        subdivisions = config.subdivisions
+        ribcage_cfg = config.ribcage
+        breasts_cfg = config.breasts
+        abdomen_cfg = config.abdomen
 
         # Ribcage: box forming upper torso
         # Offset from shoulder landmark to position top edge near shoulders
-        ribcage_y = landmarks.shoulder_y - config.ribcage.height / 2 + RIBCAGE_SHOULDER_OFFSET
-        ribcage = self._backend.create_box(
-            extents=(config.ribcage.width, config.ribcage.height, config.ribcage.depth),
-            center=(0, ribcage_y, 0),
+        ribcage_y = landmarks.shoulder_y - ribcage_cfg.height / 2 + RIBCAGE_SHOULDER_OFFSET
+        specs.append(
+            PrimitiveSpec(
+                "box",
+                "Ribcage",
+                {
+                    "extents": (ribcage_cfg.width, ribcage_cfg.height, ribcage_cfg.depth),
+                    "center": (0, ribcage_y, 0),
+                },
+            )
         )
-        ribcage.name = "Ribcage"
-        meshes.append(ribcage)
 
         # Breasts: optional paired spheres on front of ribcage
-        if config.breasts is not None:
-            breast_meshes = self._generate_paired_spheres(
-                radius=config.breasts.radius,
-                base_y=landmarks.bust_y,
-                offset_x=config.breasts.offset_x,
-                offset_z=config.breasts.offset_z,
-                subdivisions=subdivisions,
-                name_prefix="Breast",
+        if breasts_cfg is not None:
+            specs.extend(
+                self._layout_paired_spheres(
+                    radius=breasts_cfg.radius,
+                    base_y=landmarks.bust_y,
+                    offset_x=breasts_cfg.offset_x,
+                    offset_z=breasts_cfg.offset_z,
+                    subdivisions=config.subdivisions,
+                    name_prefix="Breast",
+                )
             )
-            meshes.extend(breast_meshes)
 
         # Abdomen: vertical cylinder at waist
-        abdomen = self._backend.create_cylinder(
-            radius=config.abdomen.radius,
-            height=config.abdomen.length,
-            center=(0, landmarks.waist_y, 0),
-            rotation_degrees=(90, 0, 0),  # Vertical
+        specs.append(
+            PrimitiveSpec(
+                "cylinder",
+                "Abdomen",
+                {
+                    "radius": abdomen_cfg.radius,
+                    "height": abdomen_cfg.length,
+                    "center": (0, landmarks.waist_y, 0),
+                    "rotation_degrees": (90, 0, 0),  # Vertical
+                },
+            )
         )
-        abdomen.name = "Abdomen"
-        meshes.append(abdomen)
 
-        return meshes
+        return specs
 
-    def _generate_pelvis_and_glutes(self, config: FigureConfig) -> list[MeshData]:
+    def _layout_pelvis_and_glutes(self, config: FigureConfig) -> list[PrimitiveSpec]:
         """
-        Generate pelvis and glute meshes.
+        Lay out pelvis and glute primitives.
 
         The pelvis is a box forming the hip structure. Glutes are paired
         spheres positioned behind and below the pelvis center.
@@ -422,41 +644,42 @@ class FigureGenerator:
             config: Figure configuration.
 
         Returns:
-            List containing pelvis and glute MeshData.
+            List containing pelvis and glute specs.
         """
-        meshes: list[MeshData] = []
-        landmarks = config.landmarks
-        subdivisions = config.subdivisions
+        pelvis_y = config.landmarks.pelvis_y
+        pelvis_cfg = config.pelvis
+        glutes_cfg = config.glutes
 
         # Pelvis: box at hip level
-        pelvis = self._backend.create_box(
-            extents=(config.pelvis.width, config.pelvis.height, config.pelvis.depth),
-            center=(0, landmarks.pelvis_y, 0),
+        pelvis = PrimitiveSpec(
+            "box",
+            "Pelvis",
+            {
+                "extents": (pelvis_cfg.width, pelvis_cfg.height, pelvis_cfg.depth),
+                "center": (0, pelvis_y, 0),
+            },
         )
-        pelvis.name = "Pelvis"
-        meshes.append(pelvis)
 
         # Glutes: paired spheres behind pelvis
-        glute_y = landmarks.pelvis_y + config.glutes.offset_y
-        glute_meshes = self._generate_paired_spheres(
-            radius=config.glutes.radius,
+        glute_y = pelvis_y + glutes_cfg.offset_y
+        glutes = self._layout_paired_spheres(
+            radius=glutes_cfg.radius,
             base_y=glute_y,
-            offset_x=config.glutes.offset_x,
-            offset_z=config.glutes.offset_z,
-            subdivisions=subdivisions,
+            offset_x=glutes_cfg.offset_x,
+            offset_z=glutes_cfg.offset_z,
+            subdivisions=config.subdivisions,
             name_prefix="Glute",
         )
-        meshes.extend(glute_meshes)
 
-        return meshes
+        return [pelvis, *glutes]
 
-    def _generate_arms(
+    def _layout_arms(
         self,
         config: FigureConfig,
         arm_angle: float,
-    ) -> list[MeshData]:
+    ) -> list[PrimitiveSpec]:
         """
-        Generate arm meshes for both sides.
+        Lay out arm primitives for both sides.
 
         Each arm consists of:
         - Upper arm: cylinder from shoulder to elbow
@@ -470,114 +693,105 @@ class FigureGenerator:
             arm_angle: Angle in degrees from vertical (0=down, 90=horizontal).
 
         Returns:
-            List containing all arm part MeshData (6 total: 3 per side).
-        """
-        meshes: list[MeshData] = []
-
-        shoulder_x = config.shoulder_width
-        shoulder_y = config.landmarks.shoulder_y
-        angle_rad = math.radians(arm_angle)
-
-        # Generate for both sides: Left (positive X) and Right (negative X)
-        for side_name, x_sign in [("Left", 1), ("Right", -1)]:
-            arm_parts = self._generate_single_arm(
-                config=config,
-                shoulder_x=shoulder_x,
-                shoulder_y=shoulder_y,
-                angle_rad=angle_rad,
-                arm_angle=arm_angle,
-                side_name=side_name,
-                x_sign=x_sign,
-            )
-            meshes.extend(arm_parts)
-
-        return meshes
+            List containing all arm part specs (6 total: 3 per side).
+        """
+        # Arm direction is shared by every segment on both sides, so evaluate
+        # the trig and walk the joint chain once; sides differ only in X sign
+        upper_arm_cfg = config.upper_arm
+        forearm_cfg = config.forearm
+        hand_cfg = config.hand
+
+        # The trig and rotation caches hash the angle; float() also accepts
+        # numpy scalars and 0-d arrays, which are not hashable themselves
+        arm_angle = float(arm_angle)
+        cos_a, sin_a = _sincos_deg(arm_angle)
+        chain = _arm_chain_centers(
+            shoulder_x=config.shoulder_width,
+            shoulder_y=config.landmarks.shoulder_y,
+            cos_a=cos_a,
+            sin_a=sin_a,
+            upper_arm_length=upper_arm_cfg.length,
+            forearm_length=forearm_cfg.length,
+            hand_length=hand_cfg.length,
+        )
 
-    def _generate_single_arm(
+        # Both sides written out: Left (positive X) and Right (negative X)
+        return [
+            *self._layout_single_arm(
+                config=config, chain=chain, arm_angle=arm_angle, side_name="Left", x_sign=1
+            ),
+            *self._layout_single_arm(
+                config=config, chain=chain, arm_angle=arm_angle, side_name="Right", x_sign=-1
+            ),
+        ]
+
+    def _layout_single_arm(
         self,
         config: FigureConfig,
-        shoulder_x: float,
-        shoulder_y: float,
-        angle_rad: float,
+        chain: tuple[tuple[float, float], tuple[float, float], tuple[float, float]],
         arm_angle: float,
         side_name: str,
         x_sign: int,
-    ) -> list[MeshData]:
+    ) -> list[PrimitiveSpec]:
         """
-        Generate meshes for a single arm (upper arm, forearm, hand).
+        Lay out primitives for a single arm (upper arm, forearm, hand).
 
         Args:
             config: Figure configuration.
-            shoulder_x: X distance from center to shoulder joint.
-            shoulder_y: Y height of shoulder joint.
-            angle_rad: Arm angle in radians.
+            chain: Unsigned (x, y) centers from ``_arm_chain_centers``.
             arm_angle: Arm angle in degrees (for rotation).
             side_name: "Left" or "Right".
             x_sign: 1 for left side, -1 for right side.
 
         Returns:
-            List of 3 MeshData (upper arm, forearm, hand).
+            List of 3 PrimitiveSpec (upper arm, forearm, hand).
         """
-        meshes: list[MeshData] = []
+        (upper_arm_x, upper_arm_y), (forearm_x, forearm_y), (hand_x, hand_y) = chain
+        upper_arm_cfg = config.upper_arm
+        forearm_cfg = config.forearm
+        hand_cfg = config.hand
+        rotation_z = x_sign * arm_angle
 
         # Upper arm: from shoulder, angled down/out
-        upper_arm_center, elbow_pos = self._calculate_limb_segment_position(
-            joint_x=shoulder_x,
-            joint_y=shoulder_y,
-            segment_length=config.upper_arm.length,
-            angle_rad=angle_rad,
-            x_sign=x_sign,
-        )
-
-        upper_arm = self._backend.create_cylinder(
-            radius=config.upper_arm.radius,
-            height=config.upper_arm.length,
-            center=upper_arm_center,
-            rotation_degrees=(90, 0, x_sign * arm_angle),
+        upper_arm = PrimitiveSpec(
+            "cylinder",
+            f"UpperArm_{side_name}",
+            {
+                "radius": upper_arm_cfg.radius,
+                "height": upper_arm_cfg.length,
+                "center": (x_sign * upper_arm_x, upper_arm_y, 0.0),
+                "rotation_degrees": (90, 0, rotation_z),
+            },
         )
-        upper_arm.name = f"UpperArm_{side_name}"
-        meshes.append(upper_arm)
 
         # Forearm: from elbow, continuing at same angle
-        forearm_center, wrist_pos = self._calculate_limb_segment_position(
-            joint_x=elbow_pos[0],
-            joint_y=elbow_pos[1],
-            segment_length=config.forearm.length,
-            angle_rad=angle_rad,
-            x_sign=x_sign,
+        forearm = PrimitiveSpec(
+            "cylinder",
+            f"Forearm_{side_name}",
+            {
+                "radius": forearm_cfg.radius,
+                "height": forearm_cfg.length,
+                "center": (x_sign * forearm_x, forearm_y, 0.0),
+                "rotation_degrees": (90, 0, rotation_z),
+            },
         )
 
-        forearm = self._backend.create_cylinder(
-            radius=config.forearm.radius,
-            height=config.forearm.length,
-            center=forearm_center,
-            rotation_degrees=(90, 0, x_sign * arm_angle),
-        )
-        forearm.name = f"Forearm_{side_name}"
-        meshes.append(forearm)
-
         # Hand: box at wrist, oriented along arm direction
-        hand_center = self._calculate_hand_position(
-            wrist_x=wrist_pos[0],
-            wrist_y=wrist_pos[1],
-            hand_length=config.hand.length,
-            angle_rad=angle_rad,
-            x_sign=x_sign,
-        )
-
-        hand = self._backend.create_box(
-            extents=(config.hand.width, config.hand.length, config.hand.depth),
-            center=hand_center,
-            rotation_degrees=(0, 0, x_sign * arm_angle),
+        hand = PrimitiveSpec(
+            "box",
+            f"Hand_{side_name}",
+            {
+                "extents": (hand_cfg.width, hand_cfg.length, hand_cfg.depth),
+                "center": (x_sign * hand_x, hand_y, 0.0),
+                "rotation_degrees": (0, 0, rotation_z),
+            },
         )
-        hand.name = f"Hand_{side_name}"
-        meshes.append(hand)
 
-        return meshes
+        return [upper_arm, forearm, hand]
 
-    def _generate_legs(self, config: FigureConfig) -> list[MeshData]:
+    def _layout_legs(self, config: FigureConfig) -> list[PrimitiveSpec]:
         """
-        Generate leg meshes for both sides.
+        Lay out leg primitives for both sides.
 
         Each leg consists of:
         - Thigh: vertical cylinder from hip to knee
@@ -590,96 +804,95 @@ class FigureGenerator:
             config: Figure configuration.
 
         Returns:
-            List containing all leg part MeshData (6 total: 3 per side).
+            List containing all leg part specs (6 total: 3 per side).
         """
-        meshes: list[MeshData] = []
-
+        thigh_cfg = config.thigh
+        calf_cfg = config.calf
+        foot_cfg = config.foot
         hip_x = config.hip_width
         crotch_y = config.landmarks.crotch_y
 
-        # Generate for both sides
-        for side_name, x_sign in [("Left", 1), ("Right", -1)]:
-            leg_parts = self._generate_single_leg(
-                config=config,
-                hip_x=hip_x,
-                crotch_y=crotch_y,
-                side_name=side_name,
-                x_sign=x_sign,
-            )
-            meshes.extend(leg_parts)
-
-        return meshes
-
-    def _generate_single_leg(
+        # Legs are vertical, so segment heights are shared by both sides and
+        # computed once; sides differ only in X sign
+        thigh_center_y = crotch_y - thigh_cfg.length / 2
+        knee_y = crotch_y - thigh_cfg.length
+        calf_center_y = knee_y - calf_cfg.length / 2
+        # Foot: bottom at Y=0, slightly forward of the ankle for natural stance
+        foot_center_yz = (foot_cfg.height / 2, foot_cfg.length / 2 - FOOT_FORWARD_OFFSET)
+        chain = (thigh_center_y, calf_center_y, foot_center_yz)
+
+        # Both sides written out: Left (positive X) and Right (negative X)
+        return [
+            *self._layout_single_leg(config=config, chain=chain, leg_x=hip_x, side_name="Left"),
+            *self._layout_single_leg(config=config, chain=chain, leg_x=-hip_x, side_name="Right"),
+        ]
+
+    def _layout_single_leg(
         self,
         config: FigureConfig,
-        hip_x: float,
-        crotch_y: float,
+        chain: tuple[float, float, tuple[float, float]],
+        leg_x: float,
         side_name: str,
-        x_sign: int,
-    ) -> list[MeshData]:
+    ) -> list[PrimitiveSpec]:
         """
-        Generate meshes for a single leg (thigh, calf, foot).
+        Lay out primitives for a single leg (thigh, calf, foot).
 
         Args:
             config: Figure configuration.
-            hip_x: X distance from center to hip joint.
-            crotch_y: Y height of crotch/hip joint.
+            chain: Thigh center Y, calf center Y, and foot center (Y, Z),
+                shared by both legs.
+            leg_x: Signed X position of the leg (positive = left).
             side_name: "Left" or "Right".
-            x_sign: 1 for left side, -1 for right side.
 
         Returns:
-            List of 3 MeshData (thigh, calf, foot).
+            List of 3 PrimitiveSpec (thigh, calf, foot).
         """
-        meshes: list[MeshData] = []
-
-        leg_x = x_sign * hip_x
+        thigh_center_y, calf_center_y, (foot_y, foot_z) = chain
+        thigh_cfg = config.thigh
+        calf_cfg = config.calf
+        foot_cfg = config.foot
 
         # Thigh: vertical cylinder from hip down
-        thigh_center_y = crotch_y - config.thigh.length / 2
-        thigh = self._backend.create_cylinder(
-            radius=config.thigh.radius,
-            height=config.thigh.length,
-            center=(leg_x, thigh_center_y, 0),
-            rotation_degrees=(90, 0, 0),  # Vertical
+        thigh = PrimitiveSpec(
+            "cylinder",
+            f"Thigh_{side_name}",
+            {
+                "radius": thigh_cfg.radius,
+                "height": thigh_cfg.length,
+                "center": (leg_x, thigh_center_y, 0),
+                "rotation_degrees": (90, 0, 0),  # Vertical
+            },
         )
-        thigh.name = f"Thigh_{side_name}"
-        meshes.append(thigh)
-
-        # Knee position (bottom of thigh)
-        knee_y = crotch_y - config.thigh.length
 
         # Calf: vertical cylinder from knee down
-        calf_center_y = knee_y - config.calf.length / 2
-        calf = self._backend.create_cylinder(
-            radius=config.calf.radius,
-            height=config.calf.length,
-            center=(leg_x, calf_center_y, 0),
-            rotation_degrees=(90, 0, 0),  # Vertical
-        )
-        calf.name = f"Calf_{side_name}"
-        meshes.append(calf)
-
-        # Foot: box at ground level, offset forward for natural stance
-        foot_center = (
-            leg_x,
-            config.foot.height / 2,  # Bottom of foot at Y=0
-            config.foot.length / 2 - FOOT_FORWARD_OFFSET,  # Slightly forward
+        calf = PrimitiveSpec(
+            "cylinder",
+            f"Calf_{side_name}",
+            {
+                "radius": calf_cfg.radius,
+                "height": calf_cfg.length,
+                "center": (leg_x, calf_center_y, 0),
+                "rotation_degrees": (90, 0, 0),  # Vertical
+            },
         )
-        foot = self._backend.create_box(
-            extents=(config.foot.width, config.foot.height, config.foot.length),
-            center=foot_center,
+
+        # Foot: box at ground level
+        foot = PrimitiveSpec(
+            "box",
+            f"Foot_{side_name}",
+            {
+                "extents": (foot_cfg.width, foot_cfg.height, foot_cfg.length),
+                "center": (leg_x, foot_y, foot_z),
+            },
         )
-        foot.name = f"Foot_{side_name}"
-        meshes.append(foot)
 
-        return meshes
+        return [thigh, calf, foot]
 
     # =========================================================================
     # Private Methods - Geometry Helpers
     # =========================================================================
 
-    def _generate_paired_spheres(
+    def _layout_paired_spheres(
         self,
         radius: float,
         base_y: float,
@@ -687,9 +900,9 @@ class FigureGenerator:
         offset_z: float,
         subdivisions: int,
         name_prefix: str,
-    ) -> list[MeshData]:
+    ) -> list[PrimitiveSpec]:
         """
-        Generate a symmetric pair of spheres (left and right).
+        Lay out a symmetric pair of spheres (left and right).
 
         Used for breasts, glutes, and other paired anatomical features.
 
@@ -702,94 +915,25 @@ class FigureGenerator:
             name_prefix: Name prefix (e.g., "Breast" -> "Breast_Left").
 
         Returns:
-            List of 2 MeshData (left and right spheres).
-        """
-        left = self._backend.create_sphere(
-            radius=radius,
-            center=(offset_x, base_y, offset_z),
-            subdivisions=subdivisions,
+            List of 2 PrimitiveSpec (left and right spheres).
+        """
+        left = PrimitiveSpec(
+            "sphere",
+            f"{name_prefix}_Left",
+            {
+                "radius": radius,
+                "center": (offset_x, base_y, offset_z),
+                "subdivisions": subdivisions,
+            },
         )
-        left.name = f"{name_prefix}_Left"
-
-        right = self._backend.create_sphere(
-            radius=radius,
-            center=(-offset_x, base_y, offset_z),
-            subdivisions=subdivisions,
+        right = PrimitiveSpec(
+            "sphere",
+            f"{name_prefix}_Right",
+            {
+                "radius": radius,
+                "center": (-offset_x, base_y, offset_z),
+                "subdivisions": subdivisions,
+            },
         )
-        right.name = f"{name_prefix}_Right"
 
         return [left, right]
-
-    def _calculate_limb_segment_position(
-        self,
-        joint_x: float,
-        joint_y: float,
-        segment_length: float,
-        angle_rad: float,
-        x_sign: int,
-    ) -> tuple[tuple[float, float, float], tuple[float, float]]:
-        """
-        Calculate center position and end joint for an angled limb segment.
-
-        Used for arm segments that extend at an angle from a joint.
-
-        Args:
-            joint_x: X position of the starting joint (absolute, unsigned).
-            joint_y: Y position of the starting joint.
-            segment_length: Length of the limb segment.
-            angle_rad: Angle in radians from vertical.
-            x_sign: 1 for left side, -1 for right side.
-
-        Returns:
-            Tuple of:
-                - center: (x, y, z) position for cylinder center
-                - end_joint: (x, y) position of the ending joint
-        """
-        # Calculate offset from joint to segment center
-        half_length = segment_length / 2
-        offset_x = math.cos(angle_rad) * half_length
-        offset_y = math.sin(angle_rad) * half_length
-
-        # Segment center position
-        center = (
-            x_sign * (joint_x + offset_x),
-            joint_y - offset_y,
-            0.0,
-        )
-
-        # End joint position (for connecting next segment)
-        end_joint_x = joint_x + math.cos(angle_rad) * segment_length
-        end_joint_y = joint_y - math.sin(angle_rad) * segment_length
-
-        return center, (end_joint_x, end_joint_y)
-
-    def _calculate_hand_position(
-        self,
-        wrist_x: float,
-        wrist_y: float,
-        hand_length: float,
-        angle_rad: float,
-        x_sign: int,
-    ) -> tuple[float, float, float]:
-        """
-        Calculate center position for hand box.
-
-        Args:
-            wrist_x: X position of wrist joint (absolute, unsigned).
-            wrist_y: Y position of wrist joint.
-            hand_length: Length of hand.
-            angle_rad: Arm angle in radians.
-            x_sign: 1 for left side, -1 for right side.
-
-        Returns:
-            (x, y, z) center position for hand box.
-        """
-        half_length = hand_length / 2
-        offset_x = math.cos(angle_rad) * half_length
-        offset_y = math.sin(angle_rad) * half_length
-
-        return (
-            x_sign * (wrist_x + offset_x),
-            wrist_y - offset_y,
-            0.0,
-        )
@@ -34,15 +34,21 @@ Usage:
     >>> arm_angle = POSES["apose"]  # 45 degrees
 """
 
+from __future__ import annotations
+
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
+from figure_generator.config import FigureConfig
+
 # =============================================================================
 # Pose Definitions
 # =============================================================================
 
 # Arm pose angles measured in degrees from vertical (Y-axis)
 # These standard poses are used in 3D character workflows:
-POSES: dict[str, float] = {
+_POSE_ANGLES: dict[str, float] = {
     # A-pose: Arms at 45 degrees, the ideal pose for digital sculpting.
     # Provides good shoulder definition while avoiding armpit mesh issues.
     "apose": 45.0,
@@ -54,13 +60,16 @@ POSES: dict[str, float] = {
     "relaxed": 20.0,
 }
 
+# Read-only view, so the shared pose table cannot be modified by callers
+POSES: Mapping[str, float] = MappingProxyType(_POSE_ANGLES)
+
 
 # =============================================================================
 # Figure Presets
 # =============================================================================
 
-# Built-in figure presets as raw dictionaries.
-# These are converted to FigureConfig objects by the generator when needed.
+# Built-in figure presets as raw dictionaries, parsed into PRESETS_CONFIGS
+# below.
 #
 # Each preset defines:
 #   - Basic metrics (total_heads, head_radius, subdivisions)
@@ -70,7 +79,7 @@ POSES: dict[str, float] = {
 #   - Width parameters (shoulder_width, hip_width)
 #   - Anatomical landmarks (Y-positions for key body points)
 
-PRESETS: dict[str, dict[str, Any]] = {
+_PRESET_DATA: dict[str, dict[str, Any]] = {
     # =========================================================================
     # Female Adult - 7.5 heads tall
     # =========================================================================
@@ -273,6 +282,24 @@ PRESETS: dict[str, dict[str, Any]] = {
 }
 
 
+# Read-only view of the presets. Only this top-level mapping is read-only:
+# each preset stays a plain (mutable) dict so it can be copied, customized,
+# and serialized to JSON. Editing one in place does not change the
+# import-time PRESETS_CONFIGS, so copy a preset before customizing it.
+PRESETS: Mapping[str, dict[str, Any]] = MappingProxyType(_PRESET_DATA)
+
+# Presets parsed once at import. FigureConfig is frozen, so these instances
+# are shared by every figure generated from a preset name.
+PRESETS_CONFIGS: Mapping[str, FigureConfig] = MappingProxyType(
+    {name: FigureConfig.from_dict(data) for name, data in PRESETS.items()}
+)
+
+# Preset and pose names in definition order. The tables are read-only, so the
+# names can be computed once and shared.
+PRESET_NAMES: tuple[str, ...] = tuple(PRESETS)
+POSE_NAMES: tuple[str, ...] = tuple(POSES)
+
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
@@ -282,6 +309,8 @@ def get_preset_names() -> list[str]:
     """
     Return list of available preset names.
 
+    Returns a new list on each call; use ``PRESET_NAMES`` to avoid the copy.
+
     Returns:
         List of preset name strings that can be passed to FigureGenerator.
 
@@ -290,13 +319,15 @@ def get_preset_names() -> list[str]:
         >>> print(presets)
         ['female_adult', 'male_adult', 'child', 'heroic']
     """
-    return list(PRESETS.keys())
+    return list(PRESET_NAMES)
 
 
 def get_pose_names() -> list[str]:
     """
     Return list of available pose names.
 
+    Returns a new list on each call; use ``POSE_NAMES`` to avoid the copy.
+
     Returns:
         List of pose name strings with their corresponding arm angles.
 
@@ -305,4 +336,32 @@ def get_pose_names() -> list[str]:
         >>> print(poses)
         ['apose', 'tpose', 'relaxed']
     """
-    return list(POSES.keys())
+    return list(POSE_NAMES)
+
+
+def get_preset_config(preset_name: str) -> FigureConfig:
+    """
+    Return the parsed FigureConfig for a preset.
+
+    The config is built once at import (see ``PRESETS_CONFIGS``), so every
+    call for the same name returns the same frozen instance.
+
+    Args:
+        preset_name: Name of preset (e.g., "female_adult").
+
+    Returns:
+        FigureConfig for the named preset.
+
+    Raises:
+        ValueError: If preset name is not found.
+
+    Example:
+        >>> get_preset_config("child").total_heads
+        6.0
+    """
+    config = PRESETS_CONFIGS.get(preset_name)
+    if config is None:
+        available = ", ".join(sorted(PRESETS))
+        raise ValueError(f"Unknown preset '{preset_name}'. Available: {available}")
+
+    return config
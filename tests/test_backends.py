@@ -1,7 +1,7 @@
 """Tests for figure_generator.backends module."""
 
-import tempfile
-from pathlib import Path
+import sys
+from importlib.util import find_spec
 from unittest.mock import patch
 
 import numpy as np
@@ -10,23 +10,67 @@ import pytest
 from figure_generator.backends import (
     MeshBackend,
     MeshData,
+    NumpySTLBackend,
+    PrimitiveSpec,
     TrimeshBackend,
+    apply_transform,
     create_backend,
+    create_rotation_matrix,
+    generate_box_geometry,
+    generate_cylinder_geometry,
+    generate_icosphere_geometry,
     get_available_backends,
     is_running_in_blender,
 )
 
-# Check if numpy-stl is available for conditional tests
-try:
-    from stl import mesh as _stl_mesh  # noqa: F401
+# numpy-stl is optional; find_spec checks for it without importing it at
+# collection time (NumpySTLBackend itself only imports stl when instantiated)
+HAS_NUMPY_STL = find_spec("stl") is not None
+
+# Hand-built unit cube for tests that need a MeshData without a backend-native
+# object. Shared by tests, so marked read-only.
+_UNIT_CUBE_VERTICES = np.array(
+    [
+        [0, 0, 0],
+        [1, 0, 0],
+        [1, 1, 0],
+        [0, 1, 0],
+        [0, 0, 1],
+        [1, 0, 1],
+        [1, 1, 1],
+        [0, 1, 1],
+    ],
+    dtype=float,
+)
+_UNIT_CUBE_FACES = np.array(
+    [
+        [0, 1, 2],
+        [0, 2, 3],
+        [4, 6, 5],
+        [4, 7, 6],
+        [0, 4, 5],
+        [0, 5, 1],
+        [2, 6, 7],
+        [2, 7, 3],
+        [0, 3, 7],
+        [0, 7, 4],
+        [1, 5, 6],
+        [1, 6, 2],
+    ]
+)
+_UNIT_CUBE_VERTICES.flags.writeable = False
+_UNIT_CUBE_FACES.flags.writeable = False
+
+
+def _bbox_center(vertices):
+    """Return the midpoint of a vertex array's axis-aligned bounding box."""
+    return (vertices.min(axis=0) + vertices.max(axis=0)) / 2
 
-    HAS_NUMPY_STL = True
-except ImportError:
-    HAS_NUMPY_STL = False
 
-# Only import NumpySTLBackend if numpy-stl is available
-if HAS_NUMPY_STL:
-    from figure_generator.backends import NumpySTLBackend
+def _assert_exports_nonempty(backend, meshes, path):
+    """Export meshes to path and check a non-empty file was written."""
+    backend.export(meshes, str(path))
+    assert path.stat().st_size > 0
 
 
 class TestMeshData:
@@ -53,6 +97,15 @@ class TestMeshData:
 
         assert mesh.name == ""
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_slots(self):
+        """Test MeshData instances carry no per-instance __dict__."""
+        mesh = MeshData(vertices=np.zeros((1, 3)), faces=np.zeros((1, 3), dtype=int))
+
+        assert not hasattr(mesh, "__dict__")
+        mesh.name = "renamed"
+        assert mesh.name == "renamed"
+
 
 class TestGetAvailableBackends:
     """Tests for get_available_backends function."""
@@ -81,34 +134,36 @@ class TestCreateBackend:
         backend = create_backend("trimesh")
         assert backend.name == "trimesh"
 
-    def test_invalid_backend(self):
-        """Test that invalid backend raises error."""
-        with pytest.raises((ImportError, ValueError)):
-            create_backend("nonexistent_backend")
-
-
-class TestTrimeshBackend:
-    """Tests for TrimeshBackend class."""
-
-    @pytest.fixture
-    def backend(self):
-        """Create TrimeshBackend instance."""
-        return TrimeshBackend()
-
-    def test_name(self, backend):
-        """Test backend name."""
-        assert backend.name == "trimesh"
-
-    def test_supported_formats(self, backend):
-        """Test supported formats."""
-        formats = backend.get_supported_formats()
-        assert isinstance(formats, list)
-        assert "glb" in formats
-        assert "obj" in formats
+    @pytest.mark.parametrize("name", ["nonexistent_backend", "", "TRIMESH"])
+    @patch("figure_generator.backends._check_available")
+    def test_invalid_backend(self, mock_check, name):
+        """Test that unknown names raise before probing installed libraries."""
+        with pytest.raises(ValueError, match="Unknown backend"):
+            create_backend(name)
+
+        mock_check.assert_not_called()
+
+
+class TestBackendPrimitives:
+    """Behavior shared by every standalone backend."""
+
+    @pytest.fixture(
+        scope="class",
+        params=[
+            "trimesh",
+            pytest.param(
+                "numpy-stl",
+                marks=pytest.mark.skipif(not HAS_NUMPY_STL, reason="numpy-stl not installed"),
+            ),
+        ],
+    )
+    def backend(self, request):
+        """Create one backend per parametrized name, shared by the class's tests."""
+        return create_backend(request.param)
 
     def test_create_sphere(self, backend):
         """Test creating sphere mesh."""
-        mesh = backend.create_sphere(radius=1.0, center=(0, 0, 0), subdivisions=2)
+        mesh = backend.create_sphere(radius=1.0, center=(0, 0, 0), subdivisions=0)
 
         assert isinstance(mesh, MeshData)
         assert len(mesh.vertices) > 0
@@ -116,12 +171,10 @@ class TestTrimeshBackend:
 
     def test_create_sphere_at_position(self, backend):
         """Test creating sphere at specific position."""
-        import numpy as np
-
-        mesh = backend.create_sphere(radius=1.0, center=(5, 10, 15), subdivisions=1)
+        mesh = backend.create_sphere(radius=1.0, center=(5, 10, 15), subdivisions=0)
 
         # Check that vertices are centered around the specified position
-        center = np.mean(mesh.vertices, axis=0)
+        center = _bbox_center(mesh.vertices)
         assert abs(center[0] - 5) < 0.1
         assert abs(center[1] - 10) < 0.1
         assert abs(center[2] - 15) < 0.1
@@ -129,7 +182,7 @@ class TestTrimeshBackend:
     def test_create_cylinder(self, backend):
         """Test creating cylinder mesh."""
         mesh = backend.create_cylinder(
-            radius=0.5, height=2.0, center=(0, 0, 0), rotation_degrees=(90, 0, 0)
+            radius=0.5, height=2.0, center=(0, 0, 0), rotation_degrees=(90, 0, 0), sections=6
         )
 
         assert isinstance(mesh, MeshData)
@@ -166,49 +219,115 @@ class TestTrimeshBackend:
 
         mesh = backend.create_box(extents=(2.0, 4.0, 1.0), center=(0, 0, 0))
 
-        x_extent = mesh.vertices[:, 0].max() - mesh.vertices[:, 0].min()
-        y_extent = mesh.vertices[:, 1].max() - mesh.vertices[:, 1].min()
-        z_extent = mesh.vertices[:, 2].max() - mesh.vertices[:, 2].min()
+        extents = np.ptp(mesh.vertices, axis=0)
 
-        assert abs(x_extent - 2.0) < 0.01
-        assert abs(y_extent - 4.0) < 0.01
-        assert abs(z_extent - 1.0) < 0.01
+        assert np.allclose(extents, (2.0, 4.0, 1.0), atol=0.01)
 
-    def test_export_glb(self, backend):
-        """Test exporting to GLB format."""
-        mesh = backend.create_sphere(1.0, (0, 0, 0))
-        mesh.name = "test_sphere"
+    def test_create_with_name(self, backend):
+        """Test that primitives are named at construction."""
+        assert backend.create_sphere(1.0, (0, 0, 0), subdivisions=0, name="ball").name == "ball"
+        assert backend.create_cylinder(0.5, 1.0, (0, 0, 0), sections=6, name="rod").name == "rod"
+        assert backend.create_box((1, 1, 1), (0, 0, 0), name="crate").name == "crate"
+
+    def test_create_primitives(self, backend):
+        """Test batch creation returns named meshes in spec order."""
+        specs = [
+            PrimitiveSpec("sphere", "ball", {"radius": 0.5, "center": (0, 0, 0)}),
+            PrimitiveSpec("cylinder", "rod", {"radius": 0.2, "height": 1.0, "center": (1, 0, 0)}),
+            PrimitiveSpec("box", "crate", {"extents": (1, 1, 1), "center": (0, 2, 0)}),
+        ]
 
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
+        meshes = backend.create_primitives(specs)
 
-        try:
-            backend.export([mesh], str(temp_path))
-            assert temp_path.exists()
-            assert temp_path.stat().st_size > 0
-        finally:
-            temp_path.unlink()
+        assert [m.name for m in meshes] == ["ball", "rod", "crate"]
+        assert len(meshes[2].vertices) == 8
 
-    def test_export_multiple_meshes(self, backend):
+    def test_create_primitives_groups_pairs(self, backend):
+        """Test same-shaped parts keep their own placement and order."""
+        specs = [
+            PrimitiveSpec("box", "L", {"extents": (1, 2, 1), "center": (1, 0, 0)}),
+            PrimitiveSpec("sphere", "ball", {"radius": 0.5, "center": (0, 0, 0)}),
+            PrimitiveSpec("box", "R", {"extents": (1, 2, 1), "center": (-1, 0, 0)}),
+        ]
+
+        left, _, right = backend.create_primitives(specs)
+
+        assert (left.name, right.name) == ("L", "R")
+        assert np.allclose(_bbox_center(left.vertices), (1, 0, 0))
+        assert np.allclose(_bbox_center(right.vertices), (-1, 0, 0))
+
+    def test_create_primitives_unknown_kind(self, backend):
+        """Test that an unknown primitive kind raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown primitive kind"):
+            backend.create_primitives([PrimitiveSpec("torus", "ring", {})])
+
+    def test_export_multiple_meshes(self, backend, tmp_path):
         """Test exporting multiple meshes."""
         meshes = [
-            backend.create_sphere(0.5, (0, 0, 0)),
+            backend.create_sphere(0.5, (0, 0, 0), subdivisions=0),
             backend.create_box((1, 1, 1), (2, 0, 0)),
-            backend.create_cylinder(0.3, 1.0, (0, 2, 0)),
+            backend.create_cylinder(0.3, 1.0, (0, 2, 0), sections=6),
         ]
         meshes[0].name = "sphere"
         meshes[1].name = "box"
         meshes[2].name = "cylinder"
 
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
+        file_format = backend.get_supported_formats()[0]
+        _assert_exports_nonempty(backend, meshes, tmp_path / f"out.{file_format}")
+
+
+class TestTrimeshBackend:
+    """Tests for TrimeshBackend class."""
 
-        try:
-            backend.export(meshes, str(temp_path))
-            assert temp_path.exists()
-            assert temp_path.stat().st_size > 0
-        finally:
-            temp_path.unlink()
+    @pytest.fixture(scope="class")
+    def backend(self):
+        """Create one TrimeshBackend instance shared by the class's tests."""
+        return TrimeshBackend()
+
+    def test_name(self, backend):
+        """Test backend name."""
+        assert backend.name == "trimesh"
+
+    def test_supported_formats(self, backend):
+        """Test supported formats."""
+        formats = backend.get_supported_formats()
+        assert isinstance(formats, list)
+        assert "glb" in formats
+        assert "obj" in formats
+
+    def test_create_sphere_reuses_template(self, backend):
+        """Test spheres sharing a template still get independent geometry."""
+        left = backend.create_sphere(radius=0.5, center=(1, 0, 0))
+        right = backend.create_sphere(radius=0.5, center=(-1, 0, 0))
+
+        assert np.allclose(left.vertices - (1, 0, 0), right.vertices + (1, 0, 0))
+        assert np.array_equal(left.faces, right.faces)
+        assert not np.shares_memory(left.vertices, right.vertices)
+        assert not np.shares_memory(left.faces, right.faces)
+
+    def test_create_sphere_scales_template(self, backend):
+        """Test spheres of different radii on one template get the right size."""
+        for radius in (0.25, 0.5, 1.5):
+            sphere = backend.create_sphere(radius=radius, center=(0, 2, 0), subdivisions=1)
+            distances = np.linalg.norm(sphere.vertices - (0, 2, 0), axis=1)
+            assert np.allclose(distances, radius)
+
+    def test_create_spheres_batch(self, backend):
+        """Test batched spheres are placed and named per center."""
+        spheres = backend.create_spheres_batch(
+            0.25, [(1, 0, 0), (-1, 0, 0)], subdivisions=1, names=["L", "R"]
+        )
+
+        assert [m.name for m in spheres] == ["L", "R"]
+        assert np.allclose(_bbox_center(spheres[0].vertices), (1, 0, 0))
+        assert np.allclose(_bbox_center(spheres[1].vertices), (-1, 0, 0))
+
+    def test_export_glb(self, backend, tmp_path):
+        """Test exporting to GLB format."""
+        mesh = backend.create_sphere(1.0, (0, 0, 0), subdivisions=0)
+        mesh.name = "test_sphere"
+
+        _assert_exports_nonempty(backend, [mesh], tmp_path / "out.glb")
 
 
 class TestBackendConsistency:
@@ -233,6 +352,94 @@ class TestBackendConsistency:
         assert len(mesh_high.vertices) > len(mesh_low.vertices)
 
 
+class TestApplyTransform:
+    """Tests for the shared vertex transform helper."""
+
+    def test_translate_leaves_input_unchanged(self):
+        """Test translation returns a new array and keeps the input intact."""
+        vertices = np.array([[1, 0, 0], [0, 1, 0]])
+        result = apply_transform(vertices, (0, 0, 0), (5, 0, 0))
+
+        assert result.tolist() == [[6, 0, 0], [5, 1, 0]]
+        assert vertices.tolist() == [[1, 0, 0], [0, 1, 0]]
+
+    def test_rotate_then_translate(self):
+        """Test rotation is applied about the origin before translation."""
+        vertices = np.array([[1.0, 0.0, 0.0]])
+        result = apply_transform(vertices, (0, 0, 90), (0, 0, 1))
+
+        assert np.allclose(result, [[0.0, 1.0, 1.0]])
+
+    def test_rotation_matrix_is_cached(self):
+        """Test equal angles share one read-only rotation matrix."""
+        first = create_rotation_matrix((90, 0, 45))
+        second = create_rotation_matrix([90, 0, 45])
+
+        assert first is second
+        assert not first.flags.writeable
+
+
+class TestIcosphereGeometry:
+    """Tests for the shared icosphere geometry helper."""
+
+    def test_radius(self):
+        """Test vertices lie on a sphere of the requested radius."""
+        vertices, _ = generate_icosphere_geometry(2.5, subdivisions=1)
+        assert np.allclose(np.linalg.norm(vertices, axis=1), 2.5)
+
+    def test_results_are_independent(self):
+        """Test repeated calls return separate, writable arrays."""
+        first_verts, first_faces = generate_icosphere_geometry(1.0)
+        second_verts, second_faces = generate_icosphere_geometry(1.0)
+
+        first_verts += 1.0
+        first_faces[0] = 0
+
+        assert np.allclose(np.linalg.norm(second_verts, axis=1), 1.0)
+        assert not np.array_equal(first_faces, second_faces)
+
+
+class TestPrimitiveGeometry:
+    """Tests for the shared cylinder and box geometry helpers."""
+
+    def test_cylinder_dimensions(self):
+        """Test cylinder template is scaled to the requested size."""
+        vertices, _ = generate_cylinder_geometry(0.5, 3.0, sections=8)
+        assert np.allclose(np.linalg.norm(vertices[:16, :2], axis=1), 0.5)
+        assert vertices[:, 2].min() == pytest.approx(-1.5)
+        assert vertices[:, 2].max() == pytest.approx(1.5)
+
+    def test_box_dimensions(self):
+        """Test box template is scaled to the requested extents."""
+        vertices, faces = generate_box_geometry((1.0, 2.0, 3.0))
+        assert np.allclose(vertices.max(axis=0) - vertices.min(axis=0), [1.0, 2.0, 3.0])
+        assert faces.shape == (12, 3)
+
+    @pytest.mark.parametrize(
+        "make_geometry",
+        [
+            lambda: generate_box_geometry((1.0, 1.0, 1.0)),
+            lambda: generate_cylinder_geometry(0.5, 1.0, sections=8),
+        ],
+        ids=["box", "cylinder"],
+    )
+    def test_results_are_independent(self, make_geometry):
+        """Test repeated calls return separate, writable arrays."""
+        first_verts, first_faces = make_geometry()
+        second_verts, second_faces = make_geometry()
+        expected_verts, expected_faces = second_verts.copy(), second_faces.copy()
+
+        first_verts += 1.0
+        first_faces += 1
+
+        # Neither an earlier result nor the cached template may be affected
+        fresh_verts, fresh_faces = make_geometry()
+        assert np.array_equal(second_verts, expected_verts)
+        assert np.array_equal(second_faces, expected_faces)
+        assert np.array_equal(fresh_verts, expected_verts)
+        assert np.array_equal(fresh_faces, expected_faces)
+
+
 class TestIsRunningInBlender:
     """Tests for is_running_in_blender function."""
 
@@ -258,9 +465,9 @@ class TestIsRunningInBlender:
 class TestNumpySTLBackend:
     """Tests for NumpySTLBackend class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def backend(self):
-        """Create NumpySTLBackend instance."""
+        """Create one NumpySTLBackend instance shared by the class's tests."""
         return NumpySTLBackend()
 
     def test_name(self, backend):
@@ -272,33 +479,35 @@ class TestNumpySTLBackend:
         formats = backend.get_supported_formats()
         assert formats == ["stl"]
 
-    def test_create_sphere(self, backend):
-        """Test creating sphere mesh."""
-        mesh = backend.create_sphere(radius=1.0, center=(0, 0, 0), subdivisions=2)
+    def test_create_spheres_batch(self, backend):
+        """Test batched spheres share topology but not vertex storage."""
+        left, right = backend.create_spheres_batch(0.5, [(1, 0, 0), (-1, 0, 0)], names=["L", "R"])
 
-        assert isinstance(mesh, MeshData)
-        assert len(mesh.vertices) > 0
-        assert len(mesh.faces) > 0
+        assert (left.name, right.name) == ("L", "R")
+        assert np.allclose(left.vertices - (1, 0, 0), right.vertices + (1, 0, 0))
+        assert not np.shares_memory(left.vertices, right.vertices)
 
-    def test_create_sphere_at_position(self, backend):
-        """Test creating sphere at specific position."""
-        mesh = backend.create_sphere(radius=1.0, center=(5, 10, 15), subdivisions=1)
+    def test_create_cylinders_batch(self, backend):
+        """Test batched cylinders match individually created ones."""
+        rotations = [(90, 0, 30), (90, 0, -30)]
+        batch = backend.create_cylinders_batch(
+            0.2, 1.5, [(1, 2, 0), (-1, 2, 0)], rotations, names=["L", "R"]
+        )
+        single = backend.create_cylinder(0.2, 1.5, (-1, 2, 0), (90, 0, -30))
 
-        # Check that vertices are centered around the specified position
-        center = np.mean(mesh.vertices, axis=0)
-        assert abs(center[0] - 5) < 0.5
-        assert abs(center[1] - 10) < 0.5
-        assert abs(center[2] - 15) < 0.5
+        assert [m.name for m in batch] == ["L", "R"]
+        assert np.allclose(batch[1].vertices, single.vertices)
+        assert not np.shares_memory(batch[0].faces, batch[1].faces)
 
-    def test_create_cylinder(self, backend):
-        """Test creating cylinder mesh."""
-        mesh = backend.create_cylinder(
-            radius=0.5, height=2.0, center=(0, 0, 0), rotation_degrees=(90, 0, 0)
+    def test_create_boxes_batch(self, backend):
+        """Test batched boxes match individually created ones."""
+        batch = backend.create_boxes_batch(
+            (1, 2, 3), [(0, 1, 0), (0, -1, 0)], [(0, 0, 45), (0, 0, 0)], names=["A", "B"]
         )
+        single = backend.create_box((1, 2, 3), (0, 1, 0), (0, 0, 45))
 
-        assert isinstance(mesh, MeshData)
-        assert len(mesh.vertices) > 0
-        assert len(mesh.faces) > 0
+        assert [m.name for m in batch] == ["A", "B"]
+        assert np.allclose(batch[0].vertices, single.vertices)
 
     def test_create_cylinder_with_rotation(self, backend):
         """Test creating cylinder with rotation."""
@@ -309,14 +518,6 @@ class TestNumpySTLBackend:
         assert isinstance(mesh, MeshData)
         assert len(mesh.vertices) > 0
 
-    def test_create_box(self, backend):
-        """Test creating box mesh."""
-        mesh = backend.create_box(extents=(1.0, 2.0, 0.5), center=(0, 0, 0))
-
-        assert isinstance(mesh, MeshData)
-        assert len(mesh.vertices) == 8  # Box has 8 vertices
-        assert len(mesh.faces) == 12  # Box has 12 triangular faces
-
     def test_create_box_with_rotation(self, backend):
         """Test creating box with rotation."""
         mesh = backend.create_box(
@@ -326,53 +527,12 @@ class TestNumpySTLBackend:
         assert isinstance(mesh, MeshData)
         assert len(mesh.vertices) == 8
 
-    def test_create_box_dimensions(self, backend):
-        """Test box has correct dimensions."""
-        mesh = backend.create_box(extents=(2.0, 4.0, 1.0), center=(0, 0, 0))
-
-        x_extent = mesh.vertices[:, 0].max() - mesh.vertices[:, 0].min()
-        y_extent = mesh.vertices[:, 1].max() - mesh.vertices[:, 1].min()
-        z_extent = mesh.vertices[:, 2].max() - mesh.vertices[:, 2].min()
-
-        assert abs(x_extent - 2.0) < 0.01
-        assert abs(y_extent - 4.0) < 0.01
-        assert abs(z_extent - 1.0) < 0.01
-
-    def test_export_stl(self, backend):
+    def test_export_stl(self, backend, tmp_path):
         """Test exporting to STL format."""
-        mesh = backend.create_sphere(1.0, (0, 0, 0))
+        mesh = backend.create_sphere(1.0, (0, 0, 0), subdivisions=0)
         mesh.name = "test_sphere"
 
-        with tempfile.NamedTemporaryFile(suffix=".stl", delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            backend.export([mesh], str(temp_path))
-            assert temp_path.exists()
-            assert temp_path.stat().st_size > 0
-        finally:
-            temp_path.unlink()
-
-    def test_export_multiple_meshes(self, backend):
-        """Test exporting multiple meshes."""
-        meshes = [
-            backend.create_sphere(0.5, (0, 0, 0)),
-            backend.create_box((1, 1, 1), (2, 0, 0)),
-            backend.create_cylinder(0.3, 1.0, (0, 2, 0)),
-        ]
-        meshes[0].name = "sphere"
-        meshes[1].name = "box"
-        meshes[2].name = "cylinder"
-
-        with tempfile.NamedTemporaryFile(suffix=".stl", delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            backend.export(meshes, str(temp_path))
-            assert temp_path.exists()
-            assert temp_path.stat().st_size > 0
-        finally:
-            temp_path.unlink()
+        _assert_exports_nonempty(backend, [mesh], tmp_path / "out.stl")
 
 
 @pytest.mark.skipif(not HAS_NUMPY_STL, reason="numpy-stl not installed")
@@ -393,9 +553,9 @@ class TestCreateBackendWithNumpySTL:
 class TestTrimeshBackendRotation:
     """Additional tests for TrimeshBackend rotation handling."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def backend(self):
-        """Create TrimeshBackend instance."""
+        """Create one TrimeshBackend instance shared by the class's tests."""
         return TrimeshBackend()
 
     def test_cylinder_no_rotation(self, backend):
@@ -413,48 +573,12 @@ class TestTrimeshBackendRotation:
         assert isinstance(mesh, MeshData)
         assert len(mesh.vertices) == 8
 
-    def test_export_without_native(self, backend):
+    def test_export_without_native(self, backend, tmp_path):
         """Test exporting mesh without native object."""
         # Create MeshData without native
-        vertices = np.array(
-            [
-                [0, 0, 0],
-                [1, 0, 0],
-                [1, 1, 0],
-                [0, 1, 0],
-                [0, 0, 1],
-                [1, 0, 1],
-                [1, 1, 1],
-                [0, 1, 1],
-            ],
-            dtype=float,
-        )
-        faces = np.array(
-            [
-                [0, 1, 2],
-                [0, 2, 3],
-                [4, 6, 5],
-                [4, 7, 6],
-                [0, 4, 5],
-                [0, 5, 1],
-                [2, 6, 7],
-                [2, 7, 3],
-                [0, 3, 7],
-                [0, 7, 4],
-                [1, 5, 6],
-                [1, 6, 2],
-            ]
-        )
-        mesh = MeshData(vertices=vertices, faces=faces, name="test_box")
-
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
+        mesh = MeshData(vertices=_UNIT_CUBE_VERTICES, faces=_UNIT_CUBE_FACES, name="test_box")
 
-        try:
-            backend.export([mesh], str(temp_path))
-            assert temp_path.exists()
-        finally:
-            temp_path.unlink()
+        _assert_exports_nonempty(backend, [mesh], tmp_path / "out.glb")
 
 
 class TestMeshDataWithNative:
@@ -1,21 +1,22 @@
 """Tests for figure_generator.cli module."""
 
 import json
-import tempfile
-from pathlib import Path
+import subprocess
+import sys
+from unittest.mock import patch
 
 import pytest
 
 from figure_generator.cli import create_parser, main
-from figure_generator.presets import POSES, PRESETS
+from figure_generator.presets import POSE_NAMES, POSES, PRESET_NAMES, PRESETS
 
 
 class TestCLIParser:
     """Tests for CLI argument parser."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def parser(self):
-        """Create argument parser."""
+        """Create one argument parser shared by the class's tests."""
         return create_parser()
 
     def test_default_values(self, parser):
@@ -24,7 +25,7 @@ class TestCLIParser:
 
         assert args.preset is None
         assert args.config is None
-        assert args.pose == "apose"
+        assert args.pose == POSES["apose"]
         assert args.output == "figure.glb"
 
     def test_preset_argument(self, parser):
@@ -40,7 +41,15 @@ class TestCLIParser:
     def test_pose_argument(self, parser):
         """Test --pose argument."""
         args = parser.parse_args(["--pose", "tpose"])
-        assert args.pose == "tpose"
+        assert args.pose == POSES["tpose"]
+
+    def test_invalid_pose_argument(self, parser, capsys):
+        """Test that an unknown --pose is rejected during parsing."""
+        with pytest.raises(SystemExit):
+            parser.parse_args(["--pose", "nonexistent"])
+
+        captured = capsys.readouterr()
+        assert "invalid pose" in captured.err
 
     def test_arm_angle_argument(self, parser):
         """Test --arm-angle argument."""
@@ -69,8 +78,7 @@ class TestCLIInfoCommands:
         assert result == 0
         captured = capsys.readouterr()
 
-        for preset_name in PRESETS.keys():
-            assert preset_name in captured.out
+        assert set(PRESET_NAMES) <= set(captured.out.split())
 
     def test_list_poses(self, capsys):
         """Test --list-poses command."""
@@ -79,8 +87,7 @@ class TestCLIInfoCommands:
         assert result == 0
         captured = capsys.readouterr()
 
-        for pose_name in POSES.keys():
-            assert pose_name in captured.out
+        assert set(POSE_NAMES) <= set(captured.out.split())
 
     def test_list_backends(self, capsys):
         """Test --list-backends command."""
@@ -109,98 +116,102 @@ class TestCLIInfoCommands:
         captured = capsys.readouterr()
         assert "Unknown preset" in captured.err
 
+    def test_info_commands_skip_mesh_imports(self):
+        """Test that info commands run without importing any mesh library."""
+        code = (
+            "import sys\n"
+            "from figure_generator.cli import main\n"
+            "for argv in (['--list-presets'], ['--list-poses'], ['--list-backends']):\n"
+            "    main(argv)\n"
+            "heavy = ('numpy', 'trimesh', 'stl', 'open3d', 'bpy')\n"
+            "print('LOADED:', [m for m in heavy if m in sys.modules])\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert "LOADED: []" in result.stdout
+
+    def test_info_commands_skip_generator_import(self):
+        """Test that info commands do not load the generator module."""
+        code = (
+            "import sys\n"
+            "from figure_generator.cli import main\n"
+            "for argv in (['--list-presets'], ['--generate-config', 'child']):\n"
+            "    main(argv)\n"
+            "print('GENERATOR:', 'figure_generator.generator' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert "GENERATOR: False" in result.stdout
+
 
 class TestCLIGeneration:
     """Tests for CLI figure generation."""
 
-    def test_generate_default(self, capsys):
+    def test_generate_default(self, capsys, tmp_path):
         """Test generation with default options."""
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "out.glb"
 
-        try:
-            result = main(["--output", str(temp_path)])
+        result = main(["--output", str(temp_path)])
 
-            assert result == 0
-            assert temp_path.exists()
+        assert result == 0
+        assert temp_path.exists()
 
-            captured = capsys.readouterr()
-            assert "Exported" in captured.out
-        finally:
-            temp_path.unlink()
+        captured = capsys.readouterr()
+        assert "Exported" in captured.out
 
-    def test_generate_with_preset(self, capsys):
+    def test_generate_with_preset(self, tmp_path):
         """Test generation with preset."""
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "out.glb"
 
-        try:
-            result = main(["--preset", "male_adult", "--output", str(temp_path)])
+        result = main(["--preset", "male_adult", "--output", str(temp_path)])
 
-            assert result == 0
-            assert temp_path.exists()
-        finally:
-            temp_path.unlink()
+        assert result == 0
+        assert temp_path.exists()
 
-    def test_generate_with_config_file(self, capsys):
+    def test_generate_with_config_file(self, tmp_path):
         """Test generation with config file."""
         # Create temp config file
         config_data = PRESETS["female_adult"]
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(config_data, f)
-            config_path = Path(f.name)
-
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            output_path = Path(f.name)
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(config_data), encoding="utf-8")
+        output_path = tmp_path / "out.glb"
 
-        try:
-            result = main(["--config", str(config_path), "--output", str(output_path)])
+        result = main(["--config", str(config_path), "--output", str(output_path)])
 
-            assert result == 0
-            assert output_path.exists()
-        finally:
-            config_path.unlink()
-            output_path.unlink()
+        assert result == 0
+        assert output_path.exists()
 
-    def test_generate_with_pose(self, capsys):
+    def test_generate_with_pose(self, tmp_path):
         """Test generation with pose option."""
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "out.glb"
 
-        try:
-            result = main(["--pose", "tpose", "--output", str(temp_path)])
+        result = main(["--pose", "tpose", "--output", str(temp_path)])
 
-            assert result == 0
-            assert temp_path.exists()
-        finally:
-            temp_path.unlink()
+        assert result == 0
+        assert temp_path.exists()
 
-    def test_generate_with_arm_angle(self, capsys):
+    def test_generate_with_arm_angle(self, tmp_path):
         """Test generation with custom arm angle."""
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "out.glb"
 
-        try:
-            result = main(["--arm-angle", "60", "--output", str(temp_path)])
+        result = main(["--arm-angle", "60", "--output", str(temp_path)])
 
-            assert result == 0
-            assert temp_path.exists()
-        finally:
-            temp_path.unlink()
+        assert result == 0
+        assert temp_path.exists()
 
-    def test_generate_verbose(self, capsys):
+    def test_generate_verbose(self, capsys, tmp_path):
         """Test generation with verbose output."""
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "out.glb"
 
-        try:
-            result = main(["--verbose", "--output", str(temp_path)])
+        result = main(["--verbose", "--output", str(temp_path)])
 
-            assert result == 0
-            captured = capsys.readouterr()
-            assert "Body parts:" in captured.out
-        finally:
-            temp_path.unlink()
+        assert result == 0
+        captured = capsys.readouterr()
+        assert "Body parts:" in captured.out
 
     def test_generate_nonexistent_config(self, capsys):
         """Test generation with nonexistent config file."""
@@ -214,79 +225,58 @@ class TestCLIGeneration:
 class TestCLIAllPresets:
     """Test CLI with all presets."""
 
-    @pytest.mark.parametrize("preset_name", list(PRESETS.keys()))
-    def test_generate_preset(self, preset_name):
+    @pytest.mark.parametrize("preset_name", PRESET_NAMES)
+    def test_generate_preset(self, preset_name, tmp_path):
         """Test that each preset can be generated via CLI."""
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "out.glb"
 
-        try:
-            result = main(["--preset", preset_name, "--output", str(temp_path)])
-            assert result == 0
-            assert temp_path.exists()
-            assert temp_path.stat().st_size > 0
-        finally:
-            temp_path.unlink()
+        result = main(["--preset", preset_name, "--output", str(temp_path)])
+        assert result == 0
+        assert temp_path.exists()
+        assert temp_path.stat().st_size > 0
 
 
 class TestCLIAllPoses:
     """Test CLI with all poses."""
 
-    @pytest.mark.parametrize("pose_name", list(POSES.keys()))
-    def test_generate_pose(self, pose_name):
+    @pytest.mark.parametrize("pose_name", POSE_NAMES)
+    def test_generate_pose(self, pose_name, tmp_path):
         """Test that each pose can be generated via CLI."""
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "out.glb"
 
-        try:
-            result = main(["--pose", pose_name, "--output", str(temp_path)])
-            assert result == 0
-            assert temp_path.exists()
-        finally:
-            temp_path.unlink()
+        result = main(["--pose", pose_name, "--output", str(temp_path)])
+        assert result == 0
+        assert temp_path.exists()
 
 
 class TestCLIEdgeCases:
     """Test CLI edge cases and error handling."""
 
-    def test_backend_argument(self, capsys):
+    def test_backend_argument(self, tmp_path):
         """Test --backend argument."""
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "out.glb"
 
-        try:
-            result = main(["--backend", "trimesh", "--output", str(temp_path)])
-            assert result == 0
-        finally:
-            temp_path.unlink()
+        result = main(["--backend", "trimesh", "--output", str(temp_path)])
+        assert result == 0
 
-    def test_format_argument(self, capsys):
+    def test_format_argument(self, tmp_path):
         """Test --format argument."""
-        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "out.bin"
 
-        try:
-            # Specify format explicitly
-            result = main(["--format", "glb", "--output", str(temp_path)])
-            assert result == 0
-        finally:
-            temp_path.unlink()
+        # Specify format explicitly
+        result = main(["--format", "glb", "--output", str(temp_path)])
+        assert result == 0
 
-    def test_export_error_handling(self, capsys):
+    def test_export_error_handling(self, capsys, tmp_path):
         """Test export error handling with unsupported format."""
-        with tempfile.NamedTemporaryFile(suffix=".xyz", delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            result = main(["--output", str(temp_path)])
-            assert result == 1
-            captured = capsys.readouterr()
-            assert "Error" in captured.err
-        finally:
-            if temp_path.exists():
-                temp_path.unlink()
-
-    def test_version_shown_in_help(self, capsys):
+        temp_path = tmp_path / "out.xyz"
+
+        result = main(["--output", str(temp_path)])
+        assert result == 1
+        captured = capsys.readouterr()
+        assert "Error" in captured.err
+
+    def test_version_shown_in_help(self):
         """Test that version is accessible."""
         from figure_generator.cli import create_parser
 
@@ -307,6 +297,25 @@ class TestCLIBackendListing:
         # Should show blender as not installed (since we're not in Blender)
         assert "blender" in captured.out
 
+    def test_list_backends_does_not_instantiate(self, capsys):
+        """Test that list-backends reads formats without creating backends."""
+        with patch("figure_generator.cli.create_backend") as mock_create:
+            result = main(["--list-backends"])
+
+        assert result == 0
+        mock_create.assert_not_called()
+        assert "glb" in capsys.readouterr().out
+
+    def test_list_backends_verbose_probes_backends(self, capsys):
+        """Test that --verbose queries each installed backend directly."""
+        with patch("figure_generator.cli.create_backend") as mock_create:
+            mock_create.return_value.get_supported_formats.return_value = ["probed"]
+            result = main(["--list-backends", "--verbose"])
+
+        assert result == 0
+        mock_create.assert_called()
+        assert "probed" in capsys.readouterr().out
+
 
 class TestCLIMultipleFormats:
     """Test CLI with various output formats."""
@@ -320,17 +329,13 @@ class TestCLIMultipleFormats:
             (".ply", None),
         ],
     )
-    def test_various_formats(self, suffix, format_name):
+    def test_various_formats(self, suffix, format_name, tmp_path):
         """Test generation with various output formats."""
-        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            args = ["--output", str(temp_path)]
-            if format_name:
-                args.extend(["--format", format_name])
-            result = main(args)
-            assert result == 0
-            assert temp_path.exists()
-        finally:
-            temp_path.unlink()
+        temp_path = tmp_path / f"out{suffix}"
+
+        args = ["--output", str(temp_path)]
+        if format_name:
+            args.extend(["--format", format_name])
+        result = main(args)
+        assert result == 0
+        assert temp_path.exists()
@@ -1,8 +1,8 @@
 """Tests for figure_generator.config module."""
 
+import dataclasses
 import json
-import tempfile
-from pathlib import Path
+from types import MappingProxyType
 
 import pytest
 
@@ -18,6 +18,37 @@ from figure_generator.config import (
     save_config,
 )
 
+# Shared valid config; tests derive variants with {**_VALID_CONFIG, key: value}
+_VALID_CONFIG = MappingProxyType(
+    {
+        "name": "Test Figure",
+        "total_heads": 7.5,
+        "head_radius": 0.5,
+        "subdivisions": 2,
+        "neck": {"radius": 0.11, "length": 0.35},
+        "ribcage": {"width": 1.05, "height": 1.25, "depth": 0.55},
+        "abdomen": {"radius": 0.30, "length": 0.55},
+        "pelvis": {"width": 1.1, "height": 0.7, "depth": 0.5},
+        "glutes": {"radius": 0.24, "offset_x": 0.2, "offset_y": -0.15, "offset_z": -0.22},
+        "upper_arm": {"radius": 0.105, "length": 1.15},
+        "forearm": {"radius": 0.08, "length": 1.0},
+        "hand": {"width": 0.09, "length": 0.32, "depth": 0.04},
+        "thigh": {"radius": 0.17, "length": 1.75},
+        "calf": {"radius": 0.12, "length": 1.7},
+        "foot": {"width": 0.14, "height": 0.1, "length": 0.38},
+        "shoulder_width": 0.55,
+        "hip_width": 0.28,
+        "landmarks": {
+            "shoulder_y": 5.9,
+            "bust_y": 5.4,
+            "waist_y": 4.6,
+            "pelvis_y": 4.0,
+            "crotch_y": 3.65,
+            "knee_y": 1.9,
+        },
+    }
+)
+
 
 class TestBodyPartConfig:
     """Tests for BodyPartConfig dataclass."""
@@ -43,6 +74,12 @@ class TestBodyPartConfig:
         with pytest.raises(ValueError, match="length must be positive"):
             BodyPartConfig(radius=0.5, length=-1.0)
 
+    def test_immutable(self):
+        """Test that sub-configs cannot be modified after construction."""
+        config = BodyPartConfig(radius=0.5, length=1.0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.radius = 1.0
+
 
 class TestBoxPartConfig:
     """Tests for BoxPartConfig dataclass."""
@@ -116,32 +153,8 @@ class TestFigureConfig:
     def valid_config_dict(self):
         """Return a valid configuration dictionary."""
         return {
-            "name": "Test Figure",
-            "total_heads": 7.5,
-            "head_radius": 0.5,
-            "subdivisions": 2,
-            "neck": {"radius": 0.11, "length": 0.35},
-            "ribcage": {"width": 1.05, "height": 1.25, "depth": 0.55},
+            **_VALID_CONFIG,
             "breasts": {"radius": 0.18, "offset_x": 0.22, "offset_z": 0.32, "offset_y": -0.1},
-            "abdomen": {"radius": 0.30, "length": 0.55},
-            "pelvis": {"width": 1.1, "height": 0.7, "depth": 0.5},
-            "glutes": {"radius": 0.24, "offset_x": 0.2, "offset_y": -0.15, "offset_z": -0.22},
-            "upper_arm": {"radius": 0.105, "length": 1.15},
-            "forearm": {"radius": 0.08, "length": 1.0},
-            "hand": {"width": 0.09, "length": 0.32, "depth": 0.04},
-            "thigh": {"radius": 0.17, "length": 1.75},
-            "calf": {"radius": 0.12, "length": 1.7},
-            "foot": {"width": 0.14, "height": 0.1, "length": 0.38},
-            "shoulder_width": 0.55,
-            "hip_width": 0.28,
-            "landmarks": {
-                "shoulder_y": 5.9,
-                "bust_y": 5.4,
-                "waist_y": 4.6,
-                "pelvis_y": 4.0,
-                "crotch_y": 3.65,
-                "knee_y": 1.9,
-            },
         }
 
     def test_from_dict(self, valid_config_dict):
@@ -175,6 +188,12 @@ class TestFigureConfig:
 
         assert "breasts" not in result
 
+    def test_immutable(self, valid_config_dict):
+        """Test that FigureConfig cannot be modified after construction."""
+        config = FigureConfig.from_dict(valid_config_dict)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.total_heads = 9.0
+
     def test_invalid_total_heads(self, valid_config_dict):
         """Test that invalid total_heads raises ValueError."""
         valid_config_dict["total_heads"] = -1
@@ -194,67 +213,46 @@ class TestLoadSaveConfig:
     @pytest.fixture
     def valid_config_dict(self):
         """Return a valid configuration dictionary."""
-        return {
-            "name": "Test Figure",
-            "total_heads": 7.5,
-            "head_radius": 0.5,
-            "subdivisions": 2,
-            "neck": {"radius": 0.11, "length": 0.35},
-            "ribcage": {"width": 1.05, "height": 1.25, "depth": 0.55},
-            "abdomen": {"radius": 0.30, "length": 0.55},
-            "pelvis": {"width": 1.1, "height": 0.7, "depth": 0.5},
-            "glutes": {"radius": 0.24, "offset_x": 0.2, "offset_y": -0.15, "offset_z": -0.22},
-            "upper_arm": {"radius": 0.105, "length": 1.15},
-            "forearm": {"radius": 0.08, "length": 1.0},
-            "hand": {"width": 0.09, "length": 0.32, "depth": 0.04},
-            "thigh": {"radius": 0.17, "length": 1.75},
-            "calf": {"radius": 0.12, "length": 1.7},
-            "foot": {"width": 0.14, "height": 0.1, "length": 0.38},
-            "shoulder_width": 0.55,
-            "hip_width": 0.28,
-            "landmarks": {
-                "shoulder_y": 5.9,
-                "bust_y": 5.4,
-                "waist_y": 4.6,
-                "pelvis_y": 4.0,
-                "crotch_y": 3.65,
-                "knee_y": 1.9,
-            },
-        }
+        return dict(_VALID_CONFIG)
 
-    def test_save_and_load(self, valid_config_dict):
+    def test_save_and_load(self, valid_config_dict, tmp_path):
         """Test saving and loading config round-trip."""
         config = FigureConfig.from_dict(valid_config_dict)
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "config.json"
+
+        save_config(config, temp_path)
+        loaded = load_config(temp_path)
+
+        assert loaded.name == config.name
+        assert loaded.total_heads == config.total_heads
+        assert loaded.neck.radius == config.neck.radius
+
+    def test_save_matches_to_dict(self, valid_config_dict, tmp_path):
+        """Test that the saved JSON matches to_dict() and omits None breasts."""
+        config = FigureConfig.from_dict(valid_config_dict)
+
+        temp_path = tmp_path / "config.json"
 
-        try:
-            save_config(config, temp_path)
-            loaded = load_config(temp_path)
+        save_config(config, temp_path)
+        with open(temp_path, encoding="utf-8") as f:
+            saved = json.load(f)
 
-            assert loaded.name == config.name
-            assert loaded.total_heads == config.total_heads
-            assert loaded.neck.radius == config.neck.radius
-        finally:
-            temp_path.unlink()
+        assert saved == config.to_dict()
+        assert "breasts" not in saved
 
     def test_load_nonexistent_file(self):
         """Test that loading nonexistent file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
             load_config("/nonexistent/path/config.json")
 
-    def test_load_invalid_json(self):
+    def test_load_invalid_json(self, tmp_path):
         """Test that loading invalid JSON raises JSONDecodeError."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("not valid json {{{")
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "config.json"
+        temp_path.write_text("not valid json {{{", encoding="utf-8")
 
-        try:
-            with pytest.raises(json.JSONDecodeError):
-                load_config(temp_path)
-        finally:
-            temp_path.unlink()
+        with pytest.raises(json.JSONDecodeError):
+            load_config(temp_path)
 
 
 class TestConfigEdgeCases:
@@ -299,98 +297,11 @@ class TestConfigEdgeCases:
         assert config.shoulder_y == 5.9
         assert config.knee_y == 1.9
 
-    def test_figure_config_head_radius_validation(self):
-        """Test head_radius validation in FigureConfig."""
-        config_dict = {
-            "name": "Test",
-            "total_heads": 7.5,
-            "head_radius": -0.5,  # Invalid
-            "subdivisions": 2,
-            "neck": {"radius": 0.11, "length": 0.35},
-            "ribcage": {"width": 1.05, "height": 1.25, "depth": 0.55},
-            "abdomen": {"radius": 0.30, "length": 0.55},
-            "pelvis": {"width": 1.1, "height": 0.7, "depth": 0.5},
-            "glutes": {"radius": 0.24, "offset_x": 0.2, "offset_y": -0.15, "offset_z": -0.22},
-            "upper_arm": {"radius": 0.105, "length": 1.15},
-            "forearm": {"radius": 0.08, "length": 1.0},
-            "hand": {"width": 0.09, "length": 0.32, "depth": 0.04},
-            "thigh": {"radius": 0.17, "length": 1.75},
-            "calf": {"radius": 0.12, "length": 1.7},
-            "foot": {"width": 0.14, "height": 0.1, "length": 0.38},
-            "shoulder_width": 0.55,
-            "hip_width": 0.28,
-            "landmarks": {
-                "shoulder_y": 5.9,
-                "bust_y": 5.4,
-                "waist_y": 4.6,
-                "pelvis_y": 4.0,
-                "crotch_y": 3.65,
-                "knee_y": 1.9,
-            },
-        }
-        with pytest.raises(ValueError, match="head_radius must be positive"):
-            FigureConfig.from_dict(config_dict)
-
-    def test_figure_config_shoulder_width_validation(self):
-        """Test shoulder_width validation in FigureConfig."""
-        config_dict = {
-            "name": "Test",
-            "total_heads": 7.5,
-            "head_radius": 0.5,
-            "subdivisions": 2,
-            "neck": {"radius": 0.11, "length": 0.35},
-            "ribcage": {"width": 1.05, "height": 1.25, "depth": 0.55},
-            "abdomen": {"radius": 0.30, "length": 0.55},
-            "pelvis": {"width": 1.1, "height": 0.7, "depth": 0.5},
-            "glutes": {"radius": 0.24, "offset_x": 0.2, "offset_y": -0.15, "offset_z": -0.22},
-            "upper_arm": {"radius": 0.105, "length": 1.15},
-            "forearm": {"radius": 0.08, "length": 1.0},
-            "hand": {"width": 0.09, "length": 0.32, "depth": 0.04},
-            "thigh": {"radius": 0.17, "length": 1.75},
-            "calf": {"radius": 0.12, "length": 1.7},
-            "foot": {"width": 0.14, "height": 0.1, "length": 0.38},
-            "shoulder_width": -0.55,  # Invalid
-            "hip_width": 0.28,
-            "landmarks": {
-                "shoulder_y": 5.9,
-                "bust_y": 5.4,
-                "waist_y": 4.6,
-                "pelvis_y": 4.0,
-                "crotch_y": 3.65,
-                "knee_y": 1.9,
-            },
-        }
-        with pytest.raises(ValueError, match="shoulder_width must be positive"):
-            FigureConfig.from_dict(config_dict)
-
-    def test_figure_config_hip_width_validation(self):
-        """Test hip_width validation in FigureConfig."""
-        config_dict = {
-            "name": "Test",
-            "total_heads": 7.5,
-            "head_radius": 0.5,
-            "subdivisions": 2,
-            "neck": {"radius": 0.11, "length": 0.35},
-            "ribcage": {"width": 1.05, "height": 1.25, "depth": 0.55},
-            "abdomen": {"radius": 0.30, "length": 0.55},
-            "pelvis": {"width": 1.1, "height": 0.7, "depth": 0.5},
-            "glutes": {"radius": 0.24, "offset_x": 0.2, "offset_y": -0.15, "offset_z": -0.22},
-            "upper_arm": {"radius": 0.105, "length": 1.15},
-            "forearm": {"radius": 0.08, "length": 1.0},
-            "hand": {"width": 0.09, "length": 0.32, "depth": 0.04},
-            "thigh": {"radius": 0.17, "length": 1.75},
-            "calf": {"radius": 0.12, "length": 1.7},
-            "foot": {"width": 0.14, "height": 0.1, "length": 0.38},
-            "shoulder_width": 0.55,
-            "hip_width": -0.28,  # Invalid
-            "landmarks": {
-                "shoulder_y": 5.9,
-                "bust_y": 5.4,
-                "waist_y": 4.6,
-                "pelvis_y": 4.0,
-                "crotch_y": 3.65,
-                "knee_y": 1.9,
-            },
-        }
-        with pytest.raises(ValueError, match="hip_width must be positive"):
+    @pytest.mark.parametrize(
+        "field,value", [("head_radius", -0.5), ("shoulder_width", -0.55), ("hip_width", -0.28)]
+    )
+    def test_figure_config_positive_validation(self, field, value):
+        """Test that negative head_radius/shoulder_width/hip_width are rejected."""
+        config_dict = {**_VALID_CONFIG, field: value}
+        with pytest.raises(ValueError, match=f"{field} must be positive"):
             FigureConfig.from_dict(config_dict)
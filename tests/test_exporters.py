@@ -1,8 +1,5 @@
 """Tests for figure_generator.exporters module."""
 
-import tempfile
-from pathlib import Path
-
 import pytest
 
 from figure_generator.exporters import (
@@ -40,110 +37,69 @@ class TestGetSupportedFormats:
 class TestExportFigure:
     """Tests for export_figure function."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def figure(self):
-        """Generate a figure for testing."""
+        """Generate one figure shared by the class's tests."""
         generator = FigureGenerator()
         return generator.generate("female_adult", arm_angle=45)
 
-    def test_export_glb(self, figure):
-        """Test exporting figure to GLB format."""
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            result = export_figure(figure, str(temp_path))
-            assert result == temp_path
-            assert temp_path.exists()
-            assert temp_path.stat().st_size > 0
-        finally:
-            temp_path.unlink()
-
-    def test_export_obj(self, figure):
-        """Test exporting figure to OBJ format."""
-        with tempfile.NamedTemporaryFile(suffix=".obj", delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            result = export_figure(figure, str(temp_path))
-            assert result == temp_path
-            assert temp_path.exists()
-        finally:
-            temp_path.unlink()
-
-    def test_export_stl(self, figure):
-        """Test exporting figure to STL format."""
-        with tempfile.NamedTemporaryFile(suffix=".stl", delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            result = export_figure(figure, str(temp_path))
-            assert result == temp_path
-            assert temp_path.exists()
-        finally:
-            temp_path.unlink()
-
-    def test_export_with_explicit_format(self, figure):
+    @pytest.mark.parametrize("suffix", ["glb", "obj", "stl"])
+    def test_export_format(self, figure, tmp_path, suffix):
+        """Test exporting figure to each common format."""
+        temp_path = tmp_path / f"out.{suffix}"
+
+        result = export_figure(figure, str(temp_path))
+        assert result == temp_path
+        assert temp_path.stat().st_size > 0
+
+    def test_export_with_explicit_format(self, figure, tmp_path):
         """Test exporting with explicit format override."""
-        with tempfile.NamedTemporaryFile(suffix=".bin", delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            # Export as GLB even though extension is .bin
-            result = export_figure(figure, str(temp_path), file_format="glb")
-            assert result == temp_path
-            assert temp_path.exists()
-        finally:
-            temp_path.unlink()
-
-    def test_export_with_specific_backend(self, figure):
+        temp_path = tmp_path / "out.bin"
+
+        # Export as GLB even though extension is .bin
+        result = export_figure(figure, str(temp_path), file_format="glb")
+        assert result == temp_path
+        assert temp_path.stat().st_size > 0
+
+    def test_export_with_specific_backend(self, figure, tmp_path):
         """Test exporting with specific backend."""
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "out.glb"
 
-        try:
-            result = export_figure(figure, str(temp_path), backend="trimesh")
-            assert result == temp_path
-            assert temp_path.exists()
-        finally:
-            temp_path.unlink()
+        result = export_figure(figure, str(temp_path), backend="trimesh")
+        assert result == temp_path
+        assert temp_path.stat().st_size > 0
 
-    def test_export_unsupported_format(self, figure):
+    def test_export_unsupported_format(self, figure, tmp_path):
         """Test that unsupported format raises ValueError."""
-        with tempfile.NamedTemporaryFile(suffix=".xyz", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "out.xyz"
 
-        try:
-            with pytest.raises(ValueError, match="not supported"):
-                export_figure(figure, str(temp_path))
-        finally:
-            temp_path.unlink()
+        with pytest.raises(ValueError, match="not supported"):
+            export_figure(figure, str(temp_path))
 
-    def test_export_unsupported_format_explicit(self, figure):
+    def test_export_unsupported_format_explicit(self, figure, tmp_path):
         """Test that explicitly unsupported format raises ValueError."""
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "out.glb"
 
-        try:
-            with pytest.raises(ValueError, match="not supported"):
-                export_figure(figure, str(temp_path), file_format="invalid_format")
-        finally:
-            temp_path.unlink()
+        with pytest.raises(ValueError, match="not supported"):
+            export_figure(figure, str(temp_path), file_format="invalid_format")
 
 
 class TestGetFormatInfo:
     """Tests for get_format_info function."""
 
-    def test_returns_dict(self):
+    @pytest.fixture(scope="class")
+    def info(self):
+        """Query format info once for the class's tests."""
+        return get_format_info()
+
+    def test_returns_dict(self, info):
         """Test that function returns a dictionary."""
-        info = get_format_info()
         assert isinstance(info, dict)
 
-    def test_contains_available_backends(self):
+    def test_contains_available_backends(self, info):
         """Test that info contains available backends."""
         from figure_generator.backends import get_available_backends
 
-        info = get_format_info()
         available = get_available_backends()
 
         # All available backends should be in info (except blender which can't be instantiated)
@@ -151,18 +107,14 @@ class TestGetFormatInfo:
             if backend != "blender":
                 assert backend in info
 
-    def test_backend_formats_are_lists(self):
+    def test_backend_formats_are_lists(self, info):
         """Test that each backend's formats is a list."""
-        info = get_format_info()
-
         for backend_name, formats in info.items():
             assert isinstance(formats, list), f"{backend_name} formats should be a list"
             assert len(formats) > 0, f"{backend_name} should have at least one format"
 
-    def test_trimesh_formats(self):
+    def test_trimesh_formats(self, info):
         """Test that trimesh backend has expected formats."""
-        info = get_format_info()
-
         if "trimesh" in info:
             formats = info["trimesh"]
             assert "glb" in formats
@@ -1,21 +1,58 @@
 """Tests for figure_generator.generator module."""
 
-import tempfile
-from pathlib import Path
+import copy
+import dataclasses
+from collections import OrderedDict
+from unittest.mock import patch
 
+import numpy as np
 import pytest
 
 from figure_generator.config import FigureConfig
-from figure_generator.generator import FigureGenerator, GeneratedFigure
-from figure_generator.presets import PRESETS
+from figure_generator.generator import FigureGenerator, GeneratedFigure, _sincos_deg
+from figure_generator.presets import (
+    POSE_NAMES,
+    POSES,
+    PRESET_NAMES,
+    PRESETS,
+    PRESETS_CONFIGS,
+    get_pose_names,
+    get_preset_config,
+    get_preset_names,
+)
+
+# Parts every figure has, whatever the preset
+_EXPECTED_PARTS = frozenset(
+    {
+        "Head",
+        "Neck",
+        "Ribcage",
+        "Abdomen",
+        "Pelvis",
+        "Glute_Left",
+        "Glute_Right",
+        "UpperArm_Left",
+        "UpperArm_Right",
+        "Forearm_Left",
+        "Forearm_Right",
+        "Hand_Left",
+        "Hand_Right",
+        "Thigh_Left",
+        "Thigh_Right",
+        "Calf_Left",
+        "Calf_Right",
+        "Foot_Left",
+        "Foot_Right",
+    }
+)
 
 
 class TestFigureGenerator:
     """Tests for FigureGenerator class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def generator(self):
-        """Create a FigureGenerator instance."""
+        """Create one FigureGenerator shared by the class's tests."""
         return FigureGenerator()
 
     def test_backend_name(self, generator):
@@ -29,6 +66,22 @@ class TestFigureGenerator:
         assert isinstance(formats, list)
         assert len(formats) > 0
 
+    def test_backend_created_lazily(self):
+        """Test that the default backend is only created when first needed."""
+        with patch("figure_generator.generator.create_backend") as mock_create:
+            generator = FigureGenerator()
+            mock_create.assert_not_called()
+
+            mock_create.return_value.name = "mock"
+            assert generator.backend_name == "mock"
+            assert generator.backend_name == "mock"
+
+        mock_create.assert_called_once_with()
+
+    def test_slots(self, generator):
+        """Test that generators carry no per-instance __dict__."""
+        assert not hasattr(generator, "__dict__")
+
     def test_generate_with_preset_name(self, generator):
         """Test generating figure with preset name."""
         figure = generator.generate("female_adult")
@@ -38,26 +91,65 @@ class TestFigureGenerator:
         assert "Head" in figure.part_names
 
     def test_generate_with_config_dict(self, generator):
-        """Test generating figure with config dictionary."""
-        config_dict = PRESETS["female_adult"].copy()
+        """Test generating figure from a shared config dictionary without mutating it."""
+        config_dict = PRESETS["female_adult"]
         figure = generator.generate(config_dict)
 
         assert isinstance(figure, GeneratedFigure)
         assert figure.part_count > 0
+        assert config_dict == PRESETS_CONFIGS["female_adult"].to_dict()
+
+    def test_generate_with_dict_subclass(self, generator):
+        """Test that dict subclasses are accepted as config dictionaries."""
+        config_dict = OrderedDict(PRESETS["male_adult"])
+        figure = generator.generate(config_dict)
+
+        assert figure.config.name == "Adult Male"
 
     def test_generate_with_figure_config(self, generator):
         """Test generating figure with FigureConfig instance."""
-        config = FigureConfig.from_dict(PRESETS["female_adult"])
+        config = PRESETS_CONFIGS["female_adult"]
         figure = generator.generate(config)
 
         assert isinstance(figure, GeneratedFigure)
         assert figure.part_count > 0
 
+    def test_generate_preset_config_is_shared(self, generator):
+        """Test that repeated preset generation reuses one immutable config."""
+        first = generator.generate("female_adult")
+        second = generator.generate("female_adult")
+
+        assert first.config is second.config
+        assert first.config is PRESETS_CONFIGS["female_adult"]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.config.shoulder_width = 1.0
+
+    def test_generate_dict_config_is_cached(self, generator):
+        """Test that equal config dicts resolve to the same config."""
+        first = generator.generate(copy.deepcopy(PRESETS["child"]))
+        second = generator.generate(copy.deepcopy(PRESETS["child"]))
+
+        assert first.config is second.config
+
+    def test_generate_dict_config_cache_keeps_value_types(self, generator):
+        """Test that dicts differing only in int/float values are cached apart."""
+        base = copy.deepcopy(PRESETS["child"])
+        as_int = generator.generate({**base, "total_heads": 6}).config
+        as_float = generator.generate({**base, "total_heads": 6.0}).config
+
+        assert type(as_int.total_heads) is int
+        assert type(as_float.total_heads) is float
+
     def test_generate_invalid_preset(self, generator):
         """Test that invalid preset raises ValueError."""
         with pytest.raises(ValueError, match="Unknown preset"):
             generator.generate("nonexistent_preset")
 
+    def test_generate_invalid_preset_lists_available(self, generator):
+        """Test that the unknown preset error names the available presets."""
+        with pytest.raises(ValueError, match="Available: child, female_adult, heroic, male_adult"):
+            generator.generate("nonexistent_preset")
+
     def test_generate_invalid_config_type(self, generator):
         """Test that invalid config type raises TypeError."""
         with pytest.raises(TypeError, match="must be FigureConfig"):
@@ -71,60 +163,112 @@ class TestFigureGenerator:
         assert figure_apose.arm_angle == 45
         assert figure_tpose.arm_angle == 90
 
-    def test_generate_all_presets(self, generator):
-        """Test that all presets can be generated."""
-        for preset_name in PRESETS.keys():
-            figure = generator.generate(preset_name)
-            assert figure.part_count > 0
+    @pytest.mark.parametrize("angle", [np.float64(30.0), np.array(30.0)])
+    def test_generate_with_numpy_arm_angle(self, generator, angle):
+        """Test that numpy scalar and 0-d array angles match a float angle."""
+        figure = generator.generate("female_adult", arm_angle=angle)
+        expected = generator.generate("female_adult", arm_angle=30.0)
+
+        for a, b in zip(figure.meshes, expected.meshes):
+            assert a.vertices.tolist() == b.vertices.tolist()
+
+    def test_pose_angles_precomputed(self):
+        """Test that built-in pose angles hit the trig cache."""
+        before = _sincos_deg.cache_info()
+        for angle in POSES.values():
+            _sincos_deg(angle)
+
+        assert _sincos_deg.cache_info().hits == before.hits + len(POSES)
+
+    def test_generate_many(self, generator):
+        """Test generating several poses of one figure in a batch."""
+        figures = generator.generate_many("female_adult", [0, 45, 90])
+
+        assert [f.arm_angle for f in figures] == [0, 45, 90]
+        assert figures[0].config is figures[2].config
+
+    def test_generate_many_varies_only_arms(self, generator):
+        """Test that batched poses share body layout and differ only in the arms."""
+        apose, tpose = generator.generate_many("female_adult", [45, 90])
+        apose_meshes = {mesh.name: mesh for mesh in apose.meshes}
+
+        for mesh in tpose.meshes:
+            same = np.array_equal(mesh.vertices, apose_meshes[mesh.name].vertices)
+            is_arm = mesh.name.split("_")[0] in ("UpperArm", "Forearm", "Hand")
+            assert same != is_arm, mesh.name
+
+    def test_generate_many_matches_generate(self, generator):
+        """Test that batched figures match individually generated ones."""
+        single = generator.generate("male_adult", arm_angle=30)
+        (batched,) = generator.generate_many("male_adult", [30])
+
+        assert batched.part_names == single.part_names
+        for a, b in zip(batched.meshes, single.meshes):
+            assert a.vertices.tolist() == b.vertices.tolist()
+
+    @pytest.mark.parametrize("preset_name", PRESET_NAMES)
+    def test_generate_preset(self, generator, preset_name):
+        """Test that each preset can be generated."""
+        figure = generator.generate(preset_name)
+        assert figure.part_count > 0
+
+    def test_presets_read_only(self):
+        """Test that the shared preset and pose tables cannot be modified."""
+        with pytest.raises(TypeError):
+            PRESETS["custom"] = {}
+        with pytest.raises(TypeError):
+            POSES["custom"] = 30.0
+
+    def test_preset_and_pose_names(self):
+        """Test that name helpers match the tables and return fresh lists."""
+        assert PRESET_NAMES == tuple(PRESETS)
+        assert get_preset_names() == list(PRESET_NAMES)
+        assert get_pose_names() == list(POSE_NAMES)
+        assert get_preset_names() is not get_preset_names()
+
+    def test_get_preset_config(self):
+        """Test that preset configs are shared and unknown names are rejected."""
+        assert get_preset_config("child") is PRESETS_CONFIGS["child"]
+        with pytest.raises(ValueError, match="Unknown preset"):
+            get_preset_config("nonexistent_preset")
 
     def test_generate_female_has_breasts(self, generator):
         """Test that female preset includes breasts."""
-        figure = generator.generate("female_adult")
-        assert "Breast_Left" in figure.part_names
-        assert "Breast_Right" in figure.part_names
+        names = generator.generate("female_adult").part_name_set
+        assert "Breast_Left" in names
+        assert "Breast_Right" in names
 
     def test_generate_male_no_breasts(self, generator):
         """Test that male preset does not include breasts."""
-        figure = generator.generate("male_adult")
-        assert "Breast_Left" not in figure.part_names
-        assert "Breast_Right" not in figure.part_names
+        names = generator.generate("male_adult").part_name_set
+        assert "Breast_Left" not in names
+        assert "Breast_Right" not in names
 
     def test_generate_has_all_limbs(self, generator):
         """Test that generated figure has all expected limbs."""
         figure = generator.generate("female_adult")
 
-        expected_parts = [
-            "Head",
-            "Neck",
-            "Ribcage",
-            "Abdomen",
-            "Pelvis",
-            "Glute_Left",
-            "Glute_Right",
-            "UpperArm_Left",
-            "UpperArm_Right",
-            "Forearm_Left",
-            "Forearm_Right",
-            "Hand_Left",
-            "Hand_Right",
-            "Thigh_Left",
-            "Thigh_Right",
-            "Calf_Left",
-            "Calf_Right",
-            "Foot_Left",
-            "Foot_Right",
-        ]
-
-        for part in expected_parts:
-            assert part in figure.part_names, f"Missing part: {part}"
+        missing = _EXPECTED_PARTS - figure.part_name_set
+        assert not missing, f"Missing parts: {sorted(missing)}"
+
+    def test_paired_parts_are_mirrored(self, generator):
+        """Test that left and right parts mirror each other across X=0."""
+        figure = generator.generate("female_adult", arm_angle=30)
+        meshes = {mesh.name: mesh for mesh in figure.meshes}
+
+        for part in ["Breast", "Glute", "UpperArm", "Forearm", "Hand", "Thigh", "Calf", "Foot"]:
+            left = meshes[f"{part}_Left"].vertices.mean(axis=0)
+            right = meshes[f"{part}_Right"].vertices.mean(axis=0)
+            assert left[0] == pytest.approx(-right[0], abs=1e-9), part
+            assert left[1:] == pytest.approx(right[1:], abs=1e-9), part
 
 
 class TestGeneratedFigure:
     """Tests for GeneratedFigure dataclass."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def figure(self):
-        """Create a GeneratedFigure instance."""
+        """Generate one figure shared by the class's tests."""
         generator = FigureGenerator()
         return generator.generate("female_adult", arm_angle=45)
 
@@ -134,6 +278,21 @@ class TestGeneratedFigure:
         assert isinstance(names, list)
         assert all(isinstance(n, str) for n in names)
 
+    def test_part_names_track_meshes(self, figure):
+        """Test part_names reflects meshes added after first access."""
+        figure = dataclasses.replace(figure, meshes=list(figure.meshes))
+        assert len(figure.part_names) == figure.part_count
+
+        figure.meshes.append(figure.meshes[0])
+        assert len(figure.part_names) == figure.part_count
+
+    def test_part_name_set(self, figure):
+        """Test part_name_set matches part_names and tracks mesh changes."""
+        assert figure.part_name_set == frozenset(figure.part_names)
+
+        figure = dataclasses.replace(figure, meshes=figure.meshes[:1])
+        assert figure.part_name_set == {figure.meshes[0].name}
+
     def test_part_count(self, figure):
         """Test part_count property."""
         assert figure.part_count == len(figure.meshes)
@@ -152,54 +311,23 @@ class TestGeneratedFigure:
 class TestExport:
     """Tests for figure export functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def generator(self):
-        """Create a FigureGenerator instance."""
+        """Create one FigureGenerator shared by the class's tests."""
         return FigureGenerator()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def figure(self, generator):
-        """Create a GeneratedFigure instance."""
+        """Generate one figure shared by the class's tests."""
         return generator.generate("female_adult")
 
-    def test_export_glb(self, generator, figure):
-        """Test exporting to GLB format."""
-        with tempfile.NamedTemporaryFile(suffix=".glb", delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            generator.export(figure, str(temp_path))
-            assert temp_path.exists()
-            assert temp_path.stat().st_size > 0
-        finally:
-            temp_path.unlink()
-
-    def test_export_obj(self, generator, figure):
-        """Test exporting to OBJ format."""
-        if "obj" not in generator.supported_formats:
-            pytest.skip("OBJ format not supported by backend")
-
-        with tempfile.NamedTemporaryFile(suffix=".obj", delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            generator.export(figure, str(temp_path))
-            assert temp_path.exists()
-            assert temp_path.stat().st_size > 0
-        finally:
-            temp_path.unlink()
-
-    def test_export_stl(self, generator, figure):
-        """Test exporting to STL format."""
-        if "stl" not in generator.supported_formats:
-            pytest.skip("STL format not supported by backend")
-
-        with tempfile.NamedTemporaryFile(suffix=".stl", delete=False) as f:
-            temp_path = Path(f.name)
-
-        try:
-            generator.export(figure, str(temp_path))
-            assert temp_path.exists()
-            assert temp_path.stat().st_size > 0
-        finally:
-            temp_path.unlink()
+    @pytest.mark.parametrize("suffix", ["glb", "obj", "stl"])
+    def test_export_format(self, generator, figure, tmp_path, suffix):
+        """Test exporting to each common format the backend supports."""
+        if suffix not in generator.supported_formats:
+            pytest.skip(f"{suffix.upper()} format not supported by backend")
+
+        temp_path = tmp_path / f"out.{suffix}"
+
+        generator.export(figure, str(temp_path))
+        assert temp_path.stat().st_size > 0